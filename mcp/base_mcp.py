@@ -3,8 +3,20 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
+from datetime import datetime
 import asyncio
+import json
 import logging
+import os
+import random
+import time
+
+# Rust 기반 JSON 직렬화 (미설치 시 표준 json 폴백)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from .constants.mcp import MCP_CONNECTION_STATUS, MCP_ERROR_CODES
@@ -16,7 +28,85 @@ except ImportError:
     from constants.mcp import MCP_CONNECTION_STATUS, MCP_ERROR_CODES
 
 
-@dataclass
+def write_json_file(file_path: str, data: Any) -> None:
+    """데이터를 JSON 파일로 직렬화합니다 (orjson 우선).
+
+    직렬화된 바이트 전체를 os.write 한 번으로 기록하고 fsync하여
+    대용량 파일에서도 버퍼링 청크별 write 시스템 콜을 피합니다.
+    """
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_jsonl_file(file_path: str, records: List[Any]) -> None:
+    """레코드를 줄당 하나의 JSON으로 기록합니다 (JSONL, orjson 우선).
+
+    배열 전체를 하나의 JSON 객체로 감싸지 않으므로 소비자가 파일을
+    한 줄씩 스트리밍으로 읽을 수 있습니다.
+    """
+    if ORJSON_AVAILABLE:
+        payload = b"".join(orjson.dumps(record) + b"\n" for record in records)
+    else:
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        ).encode('utf-8')
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _retry_after_hint(error: Exception) -> Optional[float]:
+    """예외에서 서버가 지정한 Retry-After 대기 시간(초)을 읽습니다.
+
+    slack_sdk 등 HTTP 기반 SDK의 예외는 response.headers를 노출하므로
+    특정 SDK에 의존하지 않고 덕 타이핑으로 읽습니다. 헤더가 없거나
+    숫자가 아니면 None을 반환합니다.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("Retry-After")
+    except AttributeError:
+        return None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# 초 단위 타임스탬프 캐시 (같은 초 내 반복 호출 시 문자열 재사용)
+# 정수 epoch로 바꾸면 포매팅 자체를 없앨 수 있지만, ISO 문자열은 저장
+# 파일과 헬스 응답의 소비자 계약이므로 형식을 유지하고 고빈도 경로의
+# datetime 생성/포매팅 비용만 이 캐시로 제거한다.
+_TS_CACHE: list = [0, ""]
+
+
+def _current_timestamp() -> str:
+    """초 단위로 캐시된 ISO 형식 타임스탬프를 반환합니다."""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.fromtimestamp(now).isoformat()
+    return _TS_CACHE[1]
+
+
+@dataclass(slots=True)
 class MCPConnectionInfo:
     """MCP 연결 정보를 나타내는 데이터 클래스."""
     server_type: str
@@ -28,7 +118,18 @@ class MCPConnectionInfo:
 
 class BaseMCP(ABC):
     """모든 MCP 서비스의 기본 클래스."""
-    
+
+    __slots__ = (
+        "server_type", "config", "connection_info", "logger",
+        "max_retries", "retry_delay", "timeout",
+        "connectivity_ttl", "_last_ok_at",
+        "__dict__",  # 서브클래스가 자유롭게 속성을 추가할 수 있도록 유지
+    )
+
+    # 검색 백엔드가 불리언 OR 쿼리를 지원하면 서브클래스에서 True로 선언
+    # (매니저가 키워드별 N회 검색 대신 단일 OR 검색을 사용)
+    supports_or_query = False
+
     def __init__(self, server_type: str, config: Dict[str, Any]):
         self.server_type = server_type
         self.config = config
@@ -42,7 +143,25 @@ class BaseMCP(ABC):
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
         self.timeout = config.get("timeout", 30)
+
+        # 최근 성공 시각 (TTL 내에는 is_connected 점검을 생략)
+        self.connectivity_ttl = config.get("connectivity_ttl", 5.0)
+        self._last_ok_at = float("-inf")
     
+    async def __aenter__(self) -> "BaseMCP":
+        """async with 진입 시 연결합니다.
+
+        AsyncExitStack.enter_async_context와 asyncio.gather를 조합하면
+        여러 통합을 동시에 띄울 수 있습니다 (MCPManager.connect_all이
+        이미 이 병렬 기동을 수행).
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """async with 종료 시 연결을 해제합니다."""
+        await self.disconnect()
+
     @abstractmethod
     async def connect(self) -> bool:
         """MCP 서버에 연결합니다."""
@@ -81,23 +200,44 @@ class BaseMCP(ABC):
     
     async def execute_with_retry(self, operation, *args, **kwargs) -> Any:
         """재시도 로직을 포함하여 작업을 실행합니다."""
+        # 재시도 없는 호출은 래핑 비용 없이 바로 실행
+        if self.max_retries == 0:
+            result = await operation(*args, **kwargs)
+            self._last_ok_at = time.monotonic()
+            if self.connection_info.status != MCP_CONNECTION_STATUS["CONNECTED"]:
+                self.update_connection_status(MCP_CONNECTION_STATUS["CONNECTED"])
+            return result
+
         last_error = None
-        
+
         for attempt in range(self.max_retries + 1):
             try:
-                if not await self.is_connected():
-                    await self.connect()
-                
+                # 최근 성공이 TTL 내에 있으면 연결 점검 생략
+                if time.monotonic() - self._last_ok_at > self.connectivity_ttl:
+                    if not await self.is_connected():
+                        await self.connect()
+
                 result = await operation(*args, **kwargs)
-                self.update_connection_status(MCP_CONNECTION_STATUS["CONNECTED"])
+                self._last_ok_at = time.monotonic()
+                if self.connection_info.status != MCP_CONNECTION_STATUS["CONNECTED"]:
+                    self.update_connection_status(MCP_CONNECTION_STATUS["CONNECTED"])
                 return result
                 
             except Exception as e:
                 last_error = str(e)
-                self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                self.logger.warning("Attempt %d failed: %s", attempt + 1, e)
                 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))  # 지수 백오프
+                    retry_after = _retry_after_hint(e)
+                    if retry_after is not None:
+                        # 레이트 리밋 응답이 지정한 시간만큼 대기 — 더 이르면
+                        # 다시 429, 더 늦으면 시간 낭비. 소폭 지터만 추가
+                        await asyncio.sleep(retry_after + random.uniform(0, 0.25))
+                    else:
+                        # 지수 백오프 + 지터 — 동시 실패한 호출자들이 같은
+                        # 순간에 재시도하는 것(thundering herd)을 흩뜨림
+                        delay = self.retry_delay * (2 ** attempt)
+                        await asyncio.sleep(delay + random.uniform(0, 0.25 * delay))
                 else:
                     self.update_connection_status(MCP_CONNECTION_STATUS["FAILED"], str(e))
                     raise e
@@ -107,8 +247,7 @@ class BaseMCP(ABC):
     
     def _get_current_timestamp(self) -> str:
         """현재 타임스탬프를 반환합니다."""
-        import datetime
-        return datetime.datetime.now().isoformat()
+        return _current_timestamp()
     
     def _validate_config(self, required_keys: List[str]) -> bool:
         """설정의 필수 키가 있는지 검증합니다."""
@@ -121,11 +260,17 @@ class BaseMCP(ABC):
     def _log_operation(self, operation: str, success: bool, details: Optional[str] = None):
         """작업 로그를 기록합니다."""
         level = logging.INFO if success else logging.ERROR
-        message = f"Operation '{operation}' {'succeeded' if success else 'failed'}"
-        if details:
-            message += f": {details}"
-        
-        self.logger.log(level, message)
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # 레벨이 통과한 경우에만 메시지를 조립 (지연 포매팅)
+        self.logger.log(
+            level,
+            "Operation '%s' %s%s",
+            operation,
+            "succeeded" if success else "failed",
+            f": {details}" if details else ""
+        )
     
     def get_error_summary(self) -> Dict[str, Any]:
         """에러 요약을 반환합니다."""
@@ -3,12 +3,13 @@
 import os
 from typing import Dict, Any, Optional
 from datetime import datetime
+import httplib2
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-import pickle
 
 from .base_mcp import BaseMCP
 
@@ -53,14 +54,23 @@ class DocsMCP(BaseMCP):
     def is_connected(self) -> bool:
         """MCP 연결 상태를 반환합니다."""
         return self._is_connected and self.health_check()
-        
-        # 토큰 파일 경로 설정
-        self.token_path = os.getenv('DOCS_TOKEN_FILE', 'docs_token.json')  # docs용 별도 토큰
-        self.credentials_path = os.getenv('CREDENTIALS_FILE', 'credentials.json')  # 공통 credentials
+
+    def _creds_fresh(self) -> bool:
+        """인증 토큰이 아직 유효한지 확인합니다 (만료 60초 전까지 재사용)."""
+        if not self.credentials or not self.credentials.valid:
+            return False
+        expiry = getattr(self.credentials, 'expiry', None)
+        if expiry is None:
+            return True
+        return (expiry - datetime.utcnow()).total_seconds() > 60
 
     def authenticate(self) -> bool:
         """Google Docs API 인증을 수행합니다."""
         try:
+            # 토큰이 아직 유효하면 기존 서비스 재사용
+            if self._creds_fresh() and self.service and self.drive_service:
+                return True
+
             print("[DEBUG] Google Docs 인증 시작")
             if os.path.exists(self.token_path):
                 print("[DEBUG] 기존 토큰 파일 발견")
@@ -86,8 +96,11 @@ class DocsMCP(BaseMCP):
                 print("[DEBUG] 새 토큰 저장됨")
             
             # Google Docs와 Drive API 서비스 생성
-            self.service = build('docs', 'v1', credentials=self.credentials)
-            self.drive_service = build('drive', 'v3', credentials=self.credentials)
+            # 두 서비스가 하나의 인증된 HTTP 커넥션 풀을 공유하도록 구성
+            # (build 호출마다 별도 httplib2.Http를 만들면 keep-alive가 되지 않음)
+            authorized_http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self.service = build('docs', 'v1', http=authorized_http)
+            self.drive_service = build('drive', 'v3', http=authorized_http)
             print("[DEBUG] Google API 서비스 초기화 완료")
             return True
             
@@ -98,7 +111,7 @@ class DocsMCP(BaseMCP):
     def upload_report(self, title: str, content: str, folder_id: Optional[str] = None) -> Dict[str, Any]:
         """텍스트 보고서를 Google Docs 문서로 업로드합니다."""
         try:
-            if not self.service or not self.drive_service:
+            if not self.service or not self.drive_service or not self._creds_fresh():
                 if not self.authenticate():
                     raise ValueError("Google Docs 인증이 필요합니다.")
             
@@ -4,23 +4,297 @@ import asyncio
 import os
 import json
 import base64
+import logging
+import random
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+import itertools
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Optional
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from .base_mcp import BaseMCP
+from .base_mcp import BaseMCP, write_json_file
+
+# C 기반 HTML 파서 (미설치 시 정규식 폴백)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+
+# HTML 폴백 파서용 사전 컴파일 패턴
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+def _html_to_text(html_content: str) -> str:
+    """HTML 본문을 일반 텍스트로 변환합니다."""
+    if SELECTOLAX_AVAILABLE:
+        return HTMLParser(html_content).text(separator=' ', strip=True)
+
+    # 폴백: 정규식으로 태그 제거 후 공백 정리
+    return _WS_RE.sub(' ', _TAG_RE.sub('', html_content)).strip()
+
+
+# 시뮬레이션 검색 결과 페이로드 (모듈 로드 시 1회 생성, 호출마다 재할당하지 않음)
+_AI_SEARCH_RESULT = MappingProxyType({
+    "id": "msg_1234567890",
+    "threadId": "thread_1234567890",
+    "snippet": "AI 연구 논의를 위한 미팅 일정 조율",
+    "score": 0.95,
+    "labelIds": ["INBOX", "Label_1234567890"]
+})
+
+_CONFERENCE_SEARCH_RESULT = MappingProxyType({
+    "id": "msg_1234567892",
+    "threadId": "thread_1234567892",
+    "snippet": "ICML 2024 컨퍼런스 참가 등록 마감일 안내",
+    "score": 0.88,
+    "labelIds": ["INBOX", "Label_1234567891"]
+})
+
+# 소문자 키워드 → 검색 결과 매핑
+_QUERY_ROUTES: Dict[str, tuple] = {
+    "ai": (_AI_SEARCH_RESULT,),
+    "conference": (_CONFERENCE_SEARCH_RESULT,),
+    "컨퍼런스": (_CONFERENCE_SEARCH_RESULT,),
+}
+
+# 라우팅 키워드를 한 번의 스캔으로 찾는 컴파일된 패턴
+_QUERY_RE = re.compile("|".join(_QUERY_ROUTES), re.IGNORECASE)
+
+# Gmail 배치 엔드포인트의 요청당 최대 허용 개수
+_BATCH_SIZE = 100
+
+# 실행 스레드별 인증 HTTP 커넥션 저장소 (TLS 핸드셰이크 재사용)
+_THREAD_LOCAL = threading.local()
+
+# metadata 형식 조회 시 요청할 헤더 allow-list
+_METADATA_HEADERS = ['From', 'To', 'Subject', 'Date', 'Cc']
+
+# _parse_message가 실제로 소비하는 헤더 (나머지는 파싱하지 않음)
+_WANTED_HEADERS = frozenset({'from', 'to', 'subject', 'date', 'cc', 'bcc'})
+
+# 본문 추출 시 mimeType → body 슬롯 디스패치 테이블
+_MIME_SLOTS = {'text/plain': 'text', 'text/html': 'html'}
+
+# 파싱 함수용 모듈 로거 (프로세스 풀에서도 동일한 네임스페이스 사용)
+_LOGGER = logging.getLogger("mcp.gmail")
+
+# CPU 바운드 파싱을 이벤트 루프 밖으로 내보내는 프로세스 풀 (지연 생성).
+# 작은 배치는 피클링 비용이 파싱 비용을 넘어서므로 임계값 이상일 때만 사용.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_THRESHOLD = 50
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """파싱용 프로세스 풀을 지연 생성하여 반환합니다."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PARSE_POOL
+
+
+def _extract_message_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """메시지 본문을 추출합니다 (프로세스 풀 전송을 위한 모듈 함수)."""
+    body = {"text": "", "html": ""}
+
+    # 본문이 직접 있는 경우
+    if payload.get('body', {}).get('data'):
+        data = payload['body']['data']
+        try:
+            decoded_body = base64.urlsafe_b64decode(data).decode('utf-8')
+            if payload.get('mimeType') == 'text/html':
+                body["html"] = decoded_body
+            else:
+                body["text"] = decoded_body
+        except Exception as e:
+            _LOGGER.error("Error decoding message body: %s", e)
+
+    # 멀티파트: 재귀 대신 스택 순회, 두 슬롯이 모두 차면 조기 종료
+    stack = deque(payload.get('parts', ()))
+    while stack and not (body["text"] and body["html"]):
+        part = stack.pop()
+        mime_type = part.get('mimeType', '')
+
+        # 첨부/인라인 이미지 파트(application/*, image/* 등)는 본문이 될 수
+        # 없으므로 하위 노드를 걷지 않고 바로 건너뜀
+        if not (mime_type.startswith('text/') or mime_type.startswith('multipart/')):
+            continue
+
+        slot = _MIME_SLOTS.get(mime_type)
+
+        if slot:
+            if not body[slot]:
+                raw = (part.get('body') or {}).get('data')
+                if raw:
+                    body[slot] = base64.urlsafe_b64decode(raw).decode('utf-8', 'replace')
+        elif 'parts' in part:
+            stack.extend(part['parts'])
+
+    return body
+
+
+def _parse_message(message: Dict[str, Any], keep_raw: bool = False) -> Dict[str, Any]:
+    """Gmail API 응답을 파싱하여 통일된 형식으로 변환합니다.
+
+    프로세스 풀로 보내 피클링할 수 있도록 모듈 레벨 함수로 둡니다.
+    기본적으로 원본 헤더 리스트는 버립니다 (parsed_headers와 중복,
+    메시지당 메모리 2~3배 차이). 원본이 필요한 호출자는 keep_raw=True.
+    """
+    payload = message.get('payload', {})
+    headers = payload.get('headers', [])
+
+    # 헤더에서 주요 정보 추출 (실제로 소비하는 헤더만 C 레벨 컴프리헨션으로 수집)
+    header_dict = {
+        name: h['value']
+        for h in headers
+        if (name := h['name'].lower()) in _WANTED_HEADERS
+    }
+
+    # 메시지 본문 추출
+    body = _extract_message_body(payload)
+
+    parsed_payload: Dict[str, Any] = {
+        "mimeType": payload.get('mimeType'),
+        "body": body
+    }
+    if keep_raw:
+        parsed_payload["headers"] = headers
+
+    return {
+        "id": message.get('id'),
+        "threadId": message.get('threadId'),
+        "labelIds": message.get('labelIds', []),
+        "snippet": message.get('snippet', ''),
+        "internalDate": message.get('internalDate'),
+        "payload": parsed_payload,
+        "parsed_headers": {
+            "from": header_dict.get('from', ''),
+            "to": header_dict.get('to', ''),
+            "subject": header_dict.get('subject', ''),
+            "date": header_dict.get('date', ''),
+            "cc": header_dict.get('cc', ''),
+            "bcc": header_dict.get('bcc', '')
+        }
+    }
+
+# 시뮬레이션 메시지 상세 템플릿 (id는 호출 시 덮어씀)
+_AI_MEETING_DETAIL = MappingProxyType({
+    "threadId": "thread_1234567890",
+    "labelIds": ["INBOX", "Label_1234567890"],
+    "snippet": "AI 연구 논의를 위한 미팅 일정 조율",
+    "historyId": "1234567890",
+    "internalDate": "1734345600000",
+    "payload": {
+        "mimeType": "text/plain",
+        "headers": [
+            {"name": "From", "value": "research.team@company.com"},
+            {"name": "To", "value": "ai.researcher@gmail.com"},
+            {"name": "Subject", "value": "AI Research Meeting Schedule"},
+            {"name": "Date", "value": "Mon, 16 Aug 2024 10:00:00 +0900"}
+        ],
+        "body": {
+            "data": "안녕하세요, AI 연구팀입니다.\n\n다음 주 AI 연구 논의를 위한 미팅 일정을 조율하고자 합니다.\n\n가능한 시간:\n- 8월 20일 (화) 오후 2-4시\n- 8월 22일 (목) 오전 10-12시\n\n어떤 시간이 편하신지 알려주세요.\n\n감사합니다."
+        }
+    },
+    "sizeEstimate": 1024
+})
+
+_GENERIC_MESSAGE_DETAIL = MappingProxyType({
+    "threadId": "thread_1234567893",
+    "labelIds": ["INBOX"],
+    "snippet": "일반적인 이메일 메시지",
+    "historyId": "1234567893",
+    "internalDate": "1734086400000",
+    "payload": {
+        "mimeType": "text/plain",
+        "headers": [
+            {"name": "From", "value": "general@example.com"},
+            {"name": "To", "value": "ai.researcher@gmail.com"},
+            {"name": "Subject", "value": "General Information"},
+            {"name": "Date", "value": "Fri, 13 Aug 2024 10:00:00 +0900"}
+        ],
+        "body": {
+            "data": "일반적인 이메일 내용입니다."
+        }
+    },
+    "sizeEstimate": 512
+})
+
+# 시뮬레이션 스레드 목록
+_THREADS = (
+    MappingProxyType({
+        "id": "thread_1234567890",
+        "snippet": "AI Research Meeting Schedule",
+        "historyId": "1234567890",
+        "messages": [
+            {
+                "id": "msg_1234567890",
+                "threadId": "thread_1234567890",
+                "labelIds": ["INBOX", "Label_1234567890"],
+                "snippet": "AI 연구 논의를 위한 미팅 일정 조율"
+            }
+        ]
+    }),
+    MappingProxyType({
+        "id": "thread_1234567891",
+        "snippet": "Paper Review Request: ML Optimization",
+        "historyId": "1234567891",
+        "messages": [
+            {
+                "id": "msg_1234567891",
+                "threadId": "thread_1234567891",
+                "labelIds": ["INBOX", "Label_1234567890"],
+                "snippet": "머신러닝 최적화 알고리즘 논문 리뷰 요청"
+            }
+        ]
+    }),
+)
+
+# 시뮬레이션 최근 활동 템플릿 (period_hours는 호출 시 덮어씀)
+_RECENT_ACTIVITY = MappingProxyType({
+    "total_messages": 45,
+    "total_threads": 23,
+    "labels_activity": [
+        {"label": "INBOX", "message_count": 25},
+        {"label": "AI Research", "message_count": 12},
+        {"label": "Conference", "message_count": 8}
+    ],
+    "top_senders": [
+        {"email": "research.team@company.com", "message_count": 8},
+        {"email": "reviewer@journal.com", "message_count": 5},
+        {"email": "registration@icml.cc", "message_count": 3}
+    ],
+    "trending_topics": ["AI Research", "Conference Registration", "Paper Review"]
+})
 
 
 class GmailMCP(BaseMCP):
     """Gmail MCP 서버 연결을 담당하는 클래스."""
-    
+
+    __slots__ = (
+        "user_id", "labels", "filters", "credentials_file", "token_file",
+        "simulate_latency", "_connected", "_service", "_credentials",
+        "_sem", "_search_cache", "_search_cache_ttl", "_search_cache_maxsize",
+        "_message_cache_file", "_message_cache",
+        "_activity_ring", "_label_counter", "_sender_counter",
+        "_labels_cache", "_labels_cache_at", "_labels_cache_ttl",
+    )
+
     # Gmail API에 필요한 권한 범위
     SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
-    
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__("gmail", config)
         
@@ -30,12 +304,93 @@ class GmailMCP(BaseMCP):
         self.filters = config.get("filters", [])
         self.credentials_file = config.get("credentials_file", os.getenv('CREDENTIALS_FILE', 'credentials.json'))  # 공통 credentials
         self.token_file = config.get("token_file", os.getenv('GMAIL_TOKEN_FILE', 'gmail_token.json'))  # gmail용 별도 토큰
-        
+
+        # 시뮬레이션 지연 여부 (프로덕션/벤치마크 실행에서는 비활성화)
+        self.simulate_latency = config.get(
+            "simulate_latency", os.getenv("MCP_SIMULATE_LATENCY", "0") == "1"
+        )
+
         # 연결 상태
         self._connected = False
         self._service = None
         self._credentials = None
-    
+
+        # 동시 요청 상한 (Gmail 사용자당 쿼터 250 quota-units/s를 넘지 않는 수준)
+        self._sem = asyncio.Semaphore(config.get("max_concurrency", 25))
+
+        # 검색 결과 캐시: (query, label_ids) → (저장 시각, 결과)
+        self._search_cache: Dict[tuple, tuple] = {}
+        self._search_cache_ttl = config.get("search_cache_ttl", 60.0)
+        self._search_cache_maxsize = config.get("search_cache_maxsize", 256)
+
+        # 파싱된 메시지 디스크 캐시 (재실행 시 변경 없는 메시지의 재다운로드 방지)
+        self._message_cache_file = config.get(
+            "message_cache_file", os.path.join("output", "gmail_data", "message_cache.jsonl")
+        )
+        self._message_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # 라벨 목록 캐시 (라벨 집합은 거의 변하지 않음)
+        self._labels_cache: Optional[List[Dict[str, Any]]] = None
+        self._labels_cache_at = 0.0
+        self._labels_cache_ttl = config.get("labels_cache_ttl", 3600.0)
+
+        # 최근 활동 집계 (메시지를 조회할 때마다 증분 갱신)
+        self._activity_ring: deque = deque(maxlen=config.get("activity_window", 1000))
+        self._label_counter: Counter = Counter()
+        self._sender_counter: Counter = Counter()
+
+    def _load_message_cache(self) -> Dict[str, Dict[str, Any]]:
+        """디스크의 메시지 캐시를 메모리로 로드합니다 (최초 1회)."""
+        if self._message_cache is not None:
+            return self._message_cache
+
+        cache: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self._message_cache_file, encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    cache[entry["id"]] = entry
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("메시지 캐시 로드 실패: %s", e)
+
+        self._message_cache = cache
+        return cache
+
+    def _append_message_cache(self, messages: List[Dict[str, Any]]) -> None:
+        """새로 받아온 메시지를 캐시 파일에 추가합니다."""
+        if not messages:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._message_cache_file), exist_ok=True)
+            with open(self._message_cache_file, 'a', encoding='utf-8') as f:
+                for message in messages:
+                    f.write(json.dumps(message, ensure_ascii=False) + "\n")
+        except Exception as e:
+            self.logger.warning("메시지 캐시 저장 실패: %s", e)
+
+    def _record_activity(self, message: Dict[str, Any]) -> None:
+        """파싱된 메시지를 활동 집계에 반영합니다."""
+        if len(self._activity_ring) == self._activity_ring.maxlen:
+            # 윈도우에서 밀려나는 메시지의 카운트 제거
+            old = self._activity_ring[0]
+            self._label_counter.subtract(old.get("labelIds", []))
+            sender = old.get("parsed_headers", {}).get("from", "")
+            if sender:
+                self._sender_counter[sender] -= 1
+
+        self._activity_ring.append(message)
+        self._label_counter.update(message.get("labelIds", []))
+        sender = message.get("parsed_headers", {}).get("from", "")
+        if sender:
+            self._sender_counter[sender] += 1
+
+    async def _simulate_delay(self, seconds: float) -> None:
+        """시뮬레이션 모드에서만 I/O 지연을 재현합니다."""
+        if self.simulate_latency:
+            await asyncio.sleep(seconds)
+
     async def connect(self) -> bool:
         """Gmail API에 연결합니다."""
         try:
@@ -62,32 +417,43 @@ class GmailMCP(BaseMCP):
             return False
     
     async def _authenticate(self):
-        """Gmail API 인증을 처리합니다."""
+        """Gmail API 인증을 처리합니다 (블로킹 호출은 스레드 풀에서 실행)."""
+        loop = asyncio.get_running_loop()
         creds = None
-        
+
         # 토큰 파일이 있으면 기존 인증 정보 로드
         if os.path.exists(self.token_file):
-            creds = Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
-        
+            creds = await loop.run_in_executor(
+                None, Credentials.from_authorized_user_file, self.token_file, self.SCOPES
+            )
+
         # 유효한 인증 정보가 없으면 새로 인증
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 # 토큰 갱신
-                creds.refresh(Request())
+                await loop.run_in_executor(None, creds.refresh, Request())
             else:
-                # 새로운 인증 플로우
+                # 새로운 인증 플로우 (로컬 서버 대기 동안 이벤트 루프를 막지 않음)
                 if not os.path.exists(self.credentials_file):
                     raise FileNotFoundError(f"Credentials file not found: {self.credentials_file}")
-                
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_file, self.SCOPES)
-                creds = flow.run_local_server(port=0)
-            
+                creds = await loop.run_in_executor(None, lambda: flow.run_local_server(port=0))
+
             # 토큰 저장
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
-        
+            await loop.run_in_executor(None, self._save_token, creds.to_json())
+
         self._credentials = creds
+
+    def _save_token(self, token_json: str) -> None:
+        """토큰을 파일에 저장합니다 (소유자만 읽을 수 있도록 0o600)."""
+        fd = os.open(self.token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, token_json.encode('utf-8'))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
     
     async def disconnect(self) -> bool:
         """Gmail API 연결을 해제합니다."""
@@ -97,6 +463,8 @@ class GmailMCP(BaseMCP):
             self._service = None
             self._credentials = None
             self._connected = False
+            self._search_cache.clear()
+            self._labels_cache = None
             self.update_connection_status("disconnected")
             self.logger.info("Successfully disconnected from Gmail API")
             
@@ -121,7 +489,7 @@ class GmailMCP(BaseMCP):
                 }
             
             # 실제 구현에서는 서버 상태 확인
-            await asyncio.sleep(0.1)
+            await self._simulate_delay(0.1)
             
             return {
                 "status": "healthy",
@@ -172,135 +540,209 @@ class GmailMCP(BaseMCP):
         """Gmail 라벨 목록을 가져오는 실제 구현."""
         if not self._service:
             raise Exception("Gmail API service not initialized. Please connect first.")
-        
+
+        # 라벨 집합은 거의 바뀌지 않으므로 TTL 내에는 캐시를 반환 (왕복 1회 절약)
+        if (self._labels_cache is not None
+                and time.monotonic() - self._labels_cache_at < self._labels_cache_ttl):
+            return self._labels_cache
+
         try:
             # Gmail API를 사용하여 라벨 목록 가져오기
             results = self._service.users().labels().list(userId=self.user_id).execute()
             labels = results.get('labels', [])
-            
+
+            self._labels_cache = labels
+            self._labels_cache_at = time.monotonic()
+
             return labels
-            
+
         except HttpError as error:
             self.logger.error(f"Gmail API error: {error}")
             raise Exception(f"Failed to fetch labels: {error}")
+
+    async def resolve_label_ids(self, label_names: List[str]) -> List[str]:
+        """라벨 이름 목록을 labelIds로 변환합니다 (이름→id 맵 캐시 활용)."""
+        if not label_names:
+            return []
+
+        labels = await self.get_labels()
+        name_to_id = {label.get('name'): label.get('id') for label in labels}
+        return [name_to_id[name] for name in label_names if name in name_to_id]
     
-    async def get_messages(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30) -> List[Dict[str, Any]]:
-        """Gmail 메시지를 가져옵니다."""
-        return await self.execute_with_retry(self._get_messages_impl, query, label_ids, max_results)
+    async def get_messages(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30, message_format: str = "full") -> List[Dict[str, Any]]:
+        """Gmail 메시지를 가져옵니다.
+
+        본문이 필요 없는 호출자는 message_format="metadata"를 지정하면
+        헤더 allow-list만 받아 응답 크기와 파싱 비용을 크게 줄일 수 있습니다.
+        """
+        return await self.execute_with_retry(self._get_messages_impl, query, label_ids, max_results, message_format)
     
-    async def _get_messages_impl(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30) -> List[Dict[str, Any]]:
+    async def _get_messages_impl(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30, message_format: str = "full") -> List[Dict[str, Any]]:
         """Gmail 메시지를 가져오는 실제 구현."""
         if not self._service:
             raise Exception("Gmail API service not initialized. Please connect first.")
         
         try:
             # Gmail API를 사용하여 메시지 목록 가져오기
-            messages_result = self._service.users().messages().list(
-                userId=self.user_id,
-                q=query,
-                labelIds=label_ids,
-                maxResults=max_results
-            ).execute()
-            
-            messages = messages_result.get('messages', [])
-            detailed_messages = []
-            
-            # 각 메시지의 상세 정보 가져오기
-            for message in messages:
+            loop = asyncio.get_running_loop()
+
+            # 페이지 토큰을 따라가며 max_results에 도달할 때까지 ID 수집
+            # (단일 list 호출은 한 페이지 한도에서 잘려 과거 메시지가 누락됨)
+            message_ids: List[str] = []
+            page_token = None
+            while len(message_ids) < max_results:
+                request = self._service.users().messages().list(
+                    userId=self.user_id,
+                    q=query,
+                    labelIds=label_ids,
+                    maxResults=min(500, max_results - len(message_ids)),
+                    pageToken=page_token
+                )
+                messages_result = await loop.run_in_executor(
+                    None, lambda: request.execute(http=self._thread_http())
+                )
+                message_ids.extend(m['id'] for m in messages_result.get('messages', []))
+
+                page_token = messages_result.get('nextPageToken')
+                if not page_token:
+                    break
+
+            message_ids = message_ids[:max_results]
+
+            # 디스크 캐시에 있는 메시지는 재다운로드하지 않음 (full 형식만 캐시)
+            cache = self._load_message_cache() if message_format == "full" else {}
+            to_fetch = [mid for mid in message_ids if mid not in cache]
+
+            parsed_by_id: Dict[str, Dict[str, Any]] = {}
+            newly_fetched: List[Dict[str, Any]] = []
+
+            # 배치 엔드포인트로 상세 정보를 100개 단위 한 번의 왕복으로 가져오기
+            # (배치 실패 시 스레드 풀 병렬 개별 조회로 폴백)
+            for start in range(0, len(to_fetch), _BATCH_SIZE):
+                chunk = to_fetch[start:start + _BATCH_SIZE]
                 try:
-                    msg_detail = self._service.users().messages().get(
-                        userId=self.user_id,
-                        id=message['id'],
-                        format='full'
-                    ).execute()
-                    
-                    # 메시지 정보 파싱
-                    parsed_message = self._parse_message(msg_detail)
-                    detailed_messages.append(parsed_message)
-                    
-                except HttpError as error:
-                    self.logger.error(f"Error fetching message {message['id']}: {error}")
-                    continue
-            
-            self.logger.info(f"Successfully fetched {len(detailed_messages)} messages")
+                    chunk_details = await loop.run_in_executor(
+                        None, self._fetch_details_batch, chunk, message_format)
+                except Exception as error:
+                    self.logger.warning("Batch fetch failed, falling back to parallel gets: %s", error)
+                    chunk_details = await self._fetch_details_parallel(chunk, message_format)
+
+                # 큰 배치는 base64/HTML 디코딩을 프로세스 풀로 내보내
+                # 이벤트 루프가 다음 HTTP 요청을 계속 발행할 수 있게 함
+                if len(chunk_details) >= _PARSE_POOL_THRESHOLD:
+                    parsed_chunk = await asyncio.gather(*(
+                        loop.run_in_executor(_get_parse_pool(), _parse_message, md)
+                        for md in chunk_details
+                    ))
+                else:
+                    parsed_chunk = [_parse_message(md) for md in chunk_details]
+
+                for parsed_message in parsed_chunk:
+                    parsed_by_id[parsed_message["id"]] = parsed_message
+                    newly_fetched.append(parsed_message)
+                    self._record_activity(parsed_message)
+
+            if message_format == "full":
+                cache.update(parsed_by_id)
+                self._append_message_cache(newly_fetched)
+            else:
+                cache = parsed_by_id
+
+            detailed_messages = [cache[mid] for mid in message_ids if mid in cache]
+
+            self.logger.info(
+                "Successfully fetched %d messages (%d from cache)",
+                len(detailed_messages), len(detailed_messages) - len(newly_fetched)
+            )
             return detailed_messages
             
         except HttpError as error:
             self.logger.error(f"Gmail API error: {error}")
             raise Exception(f"Failed to fetch messages: {error}")
     
-    def _parse_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    def _thread_http(self) -> AuthorizedHttp:
+        """현재 실행 스레드에서 재사용하는 인증된 HTTP 커넥션을 반환합니다.
+
+        googleapiclient는 http 인자를 주지 않으면 execute마다 새 연결을
+        만들어 병렬 조회가 매번 TLS 핸드셰이크를 다시 치르게 됩니다.
+        """
+        if (getattr(_THREAD_LOCAL, 'http', None) is None
+                or getattr(_THREAD_LOCAL, 'creds', None) is not self._credentials):
+            _THREAD_LOCAL.http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            _THREAD_LOCAL.creds = self._credentials
+        return _THREAD_LOCAL.http
+
+    def _get_request_kwargs(self, message_format: str) -> Dict[str, Any]:
+        """messages().get 호출 인자를 형식에 맞게 구성합니다."""
+        kwargs: Dict[str, Any] = {"userId": self.user_id, "format": message_format}
+        if message_format == "metadata":
+            # 필요한 헤더만 받아 응답 크기를 줄임
+            kwargs["metadataHeaders"] = _METADATA_HEADERS
+        return kwargs
+
+    def _fetch_details_batch(self, message_ids: List[str], message_format: str = "full") -> List[Dict[str, Any]]:
+        """배치 HTTP 요청으로 여러 메시지의 상세 정보를 가져옵니다."""
+        responses: Dict[str, Dict[str, Any]] = {}
+        get_kwargs = self._get_request_kwargs(message_format)
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                self.logger.error("Error fetching message %s: %s", request_id, exception)
+                return
+            responses[request_id] = response
+
+        batch = self._service.new_batch_http_request(callback=_collect)
+        for message_id in message_ids:
+            batch.add(
+                self._service.users().messages().get(id=message_id, **get_kwargs),
+                request_id=message_id
+            )
+        batch.execute()
+
+        # 요청 순서를 유지하며 실패한 항목은 건너뜀
+        return [responses[mid] for mid in message_ids if mid in responses]
+
+    async def _fetch_details_parallel(self, message_ids: List[str], message_format: str = "full") -> List[Dict[str, Any]]:
+        """배치 엔드포인트 실패 시 개별 get을 스레드 풀에서 병렬 실행합니다."""
+        loop = asyncio.get_running_loop()
+        get_kwargs = self._get_request_kwargs(message_format)
+
+        async def _fetch(message_id: str) -> Dict[str, Any]:
+            async with self._sem:
+                # 429/5xx는 지수 백오프 + 지터로 재시도 (쿼터 초과 시 직렬화 방지)
+                for attempt in range(5):
+                    try:
+                        return await loop.run_in_executor(
+                            None,
+                            lambda: self._service.users().messages().get(
+                                id=message_id, **get_kwargs
+                            ).execute(http=self._thread_http())
+                        )
+                    except HttpError as error:
+                        status = getattr(error.resp, 'status', None)
+                        if status in (429, 500, 502, 503) and attempt < 4:
+                            await asyncio.sleep(min(2 ** attempt + random.random(), 32))
+                            continue
+                        raise
+
+        results = await asyncio.gather(*(_fetch(mid) for mid in message_ids), return_exceptions=True)
+
+        details = []
+        for message_id, result in zip(message_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error fetching message %s: %s", message_id, result)
+                continue
+            details.append(result)
+        return details
+
+    def _parse_message(self, message: Dict[str, Any], keep_raw: bool = False) -> Dict[str, Any]:
         """Gmail API 응답을 파싱하여 통일된 형식으로 변환합니다."""
-        payload = message.get('payload', {})
-        headers = payload.get('headers', [])
-        
-        # 헤더에서 주요 정보 추출
-        header_dict = {}
-        for header in headers:
-            header_dict[header['name'].lower()] = header['value']
-        
-        # 메시지 본문 추출
-        body = self._extract_message_body(payload)
-        
-        return {
-            "id": message.get('id'),
-            "threadId": message.get('threadId'),
-            "labelIds": message.get('labelIds', []),
-            "snippet": message.get('snippet', ''),
-            "historyId": message.get('historyId'),
-            "internalDate": message.get('internalDate'),
-            "sizeEstimate": message.get('sizeEstimate'),
-            "payload": {
-                "mimeType": payload.get('mimeType'),
-                "headers": headers,
-                "body": body
-            },
-            "parsed_headers": {
-                "from": header_dict.get('from', ''),
-                "to": header_dict.get('to', ''),
-                "subject": header_dict.get('subject', ''),
-                "date": header_dict.get('date', ''),
-                "cc": header_dict.get('cc', ''),
-                "bcc": header_dict.get('bcc', '')
-            }
-        }
-    
+        return _parse_message(message, keep_raw)
+
     def _extract_message_body(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """메시지 본문을 추출합니다."""
-        body = {"text": "", "html": ""}
-        
-        def extract_parts(part):
-            if part.get('mimeType') == 'text/plain':
-                data = part.get('body', {}).get('data', '')
-                if data:
-                    body["text"] = base64.urlsafe_b64decode(data).decode('utf-8')
-            elif part.get('mimeType') == 'text/html':
-                data = part.get('body', {}).get('data', '')
-                if data:
-                    body["html"] = base64.urlsafe_b64decode(data).decode('utf-8')
-            elif 'parts' in part:
-                for subpart in part['parts']:
-                    extract_parts(subpart)
-        
-        # 본문이 직접 있는 경우
-        if payload.get('body', {}).get('data'):
-            data = payload['body']['data']
-            try:
-                decoded_body = base64.urlsafe_b64decode(data).decode('utf-8')
-                if payload.get('mimeType') == 'text/html':
-                    body["html"] = decoded_body
-                else:
-                    body["text"] = decoded_body
-            except Exception as e:
-                self.logger.error(f"Error decoding message body: {e}")
-        
-        # 멀티파트 메시지인 경우
-        if 'parts' in payload:
-            for part in payload['parts']:
-                extract_parts(part)
-        
-        return body
-    
+        return _extract_message_body(payload)
+
     async def get_message_details(self, message_id: str) -> Dict[str, Any]:
         """메시지 상세 정보를 가져옵니다."""
         return await self.execute_with_retry(self._get_message_details_impl, message_id)
@@ -310,88 +752,61 @@ class GmailMCP(BaseMCP):
         # 실제 구현에서는 MCP를 통해 메시지 상세 정보를 가져옵니다
         # 현재는 시뮬레이션된 데이터를 반환
         
-        await asyncio.sleep(0.4)
-        
-        # 메시지 ID에 따른 상세 정보 생성
+        await self._simulate_delay(0.4)
+
+        # 메시지 ID에 따른 상세 정보 생성 (사전 구축된 템플릿에 id만 덮어씀)
         if "AI Research Meeting" in message_id:
-            return {
-                "id": message_id,
-                "threadId": "thread_1234567890",
-                "labelIds": ["INBOX", "Label_1234567890"],
-                "snippet": "AI 연구 논의를 위한 미팅 일정 조율",
-                "historyId": "1234567890",
-                "internalDate": "1734345600000",
-                "payload": {
-                    "mimeType": "text/plain",
-                    "headers": [
-                        {"name": "From", "value": "research.team@company.com"},
-                        {"name": "To", "value": "ai.researcher@gmail.com"},
-                        {"name": "Subject", "value": "AI Research Meeting Schedule"},
-                        {"name": "Date", "value": "Mon, 16 Aug 2024 10:00:00 +0900"}
-                    ],
-                    "body": {
-                        "data": "안녕하세요, AI 연구팀입니다.\n\n다음 주 AI 연구 논의를 위한 미팅 일정을 조율하고자 합니다.\n\n가능한 시간:\n- 8월 20일 (화) 오후 2-4시\n- 8월 22일 (목) 오전 10-12시\n\n어떤 시간이 편하신지 알려주세요.\n\n감사합니다."
-                    }
-                },
-                "sizeEstimate": 1024
-            }
+            return {"id": message_id, **_AI_MEETING_DETAIL}
         else:
-            return {
-                "id": message_id,
-                "threadId": "thread_1234567893",
-                "labelIds": ["INBOX"],
-                "snippet": "일반적인 이메일 메시지",
-                "historyId": "1234567893",
-                "internalDate": "1734086400000",
-                "payload": {
-                    "mimeType": "text/plain",
-                    "headers": [
-                        {"name": "From", "value": "general@example.com"},
-                        {"name": "To", "value": "ai.researcher@gmail.com"},
-                        {"name": "Subject", "value": "General Information"},
-                        {"name": "Date", "value": "Fri, 13 Aug 2024 10:00:00 +0900"}
-                    ],
-                    "body": {
-                        "data": "일반적인 이메일 내용입니다."
-                    }
-                },
-                "sizeEstimate": 512
-            }
+            return {"id": message_id, **_GENERIC_MESSAGE_DETAIL}
     
+    async def get_message_details_batch(self, message_ids: List[str]) -> List[Dict[str, Any]]:
+        """여러 메시지의 상세 정보를 동시성 제한 하에 병렬로 가져옵니다."""
+        async def _one(message_id: str) -> Dict[str, Any]:
+            async with self._sem:
+                return await self.execute_with_retry(self._get_message_details_impl, message_id)
+
+        results = await asyncio.gather(*(_one(mid) for mid in message_ids), return_exceptions=True)
+
+        details = []
+        for message_id, result in zip(message_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error fetching message %s: %s", message_id, result)
+                continue
+            details.append(result)
+        return details
+
     async def search_messages(self, query: str, label_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """메시지를 검색합니다."""
-        return await self.execute_with_retry(self._search_messages_impl, query, label_ids)
+        """메시지를 검색합니다. 동일한 검색은 TTL 내에 캐시된 결과를 반환합니다."""
+        key = (query, tuple(label_ids) if label_ids else None)
+        now = time.monotonic()
+
+        cached = self._search_cache.get(key)
+        if cached and now - cached[0] < self._search_cache_ttl:
+            return list(cached[1])
+
+        results = await self.execute_with_retry(self._search_messages_impl, query, label_ids)
+
+        # 캐시 크기 제한 (가장 오래된 항목부터 제거)
+        if len(self._search_cache) >= self._search_cache_maxsize:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = (now, results)
+
+        return list(results)
     
     async def _search_messages_impl(self, query: str, label_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """메시지 검색의 실제 구현."""
         # 실제 구현에서는 MCP를 통해 메시지 검색을 수행
         # 현재는 시뮬레이션된 검색 결과를 반환
         
-        await asyncio.sleep(0.6)
-        
-        # 쿼리에 따른 검색 결과 생성
-        if "AI" in query or "ai" in query:
-            return [
-                {
-                    "id": "msg_1234567890",
-                    "threadId": "thread_1234567890",
-                    "snippet": "AI 연구 논의를 위한 미팅 일정 조율",
-                    "score": 0.95,
-                    "labelIds": ["INBOX", "Label_1234567890"]
-                }
-            ]
-        elif "conference" in query or "컨퍼런스" in query:
-            return [
-                {
-                    "id": "msg_1234567892",
-                    "threadId": "thread_1234567892",
-                    "snippet": "ICML 2024 컨퍼런스 참가 등록 마감일 안내",
-                    "score": 0.88,
-                    "labelIds": ["INBOX", "Label_1234567891"]
-                }
-            ]
-        else:
-            return []
+        await self._simulate_delay(0.6)
+
+        # 쿼리에 따른 검색 결과 조회 (단일 정규식 스캔 후 라우팅 테이블 참조)
+        match = _QUERY_RE.search(query)
+        if match:
+            results = _QUERY_ROUTES.get(match.group(0).casefold(), ())
+            return [dict(result) for result in results]
+        return []
     
     async def get_threads(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 100) -> List[Dict[str, Any]]:
         """Gmail 스레드를 가져옵니다."""
@@ -402,37 +817,21 @@ class GmailMCP(BaseMCP):
         # 실제 구현에서는 MCP를 통해 스레드 정보를 가져옵니다
         # 현재는 시뮬레이션된 데이터를 반환
         
-        await asyncio.sleep(0.4)
-        
-        return [
-            {
-                "id": "thread_1234567890",
-                "snippet": "AI Research Meeting Schedule",
-                "historyId": "1234567890",
-                "messages": [
-                    {
-                        "id": "msg_1234567890",
-                        "threadId": "thread_1234567890",
-                        "labelIds": ["INBOX", "Label_1234567890"],
-                        "snippet": "AI 연구 논의를 위한 미팅 일정 조율"
-                    }
-                ]
-            },
-            {
-                "id": "thread_1234567891",
-                "snippet": "Paper Review Request: ML Optimization",
-                "historyId": "1234567891",
-                "messages": [
-                    {
-                        "id": "msg_1234567891",
-                        "threadId": "thread_1234567891",
-                        "labelIds": ["INBOX", "Label_1234567890"],
-                        "snippet": "머신러닝 최적화 알고리즘 논문 리뷰 요청"
-                    }
-                ]
-            }
-        ][:max_results]
+        await self._simulate_delay(0.4)
+
+        return [dict(thread) for thread in _THREADS[:max_results]]
     
+    async def iter_threads(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """스레드를 비동기 제너레이터로 순회합니다.
+
+        get_threads와 달리 전체 리스트를 만들지 않으므로 일부만 소비하는
+        호출자는 나머지 항목의 생성 비용을 내지 않습니다.
+        """
+        await self._simulate_delay(0.4)
+
+        for thread in itertools.islice(_THREADS, max_results):
+            yield dict(thread)
+
     async def get_recent_activity(self, hours: int = 24) -> Dict[str, Any]:
         """최근 활동을 가져옵니다."""
         return await self.execute_with_retry(self._get_recent_activity_impl, hours)
@@ -442,25 +841,59 @@ class GmailMCP(BaseMCP):
         # 실제 구현에서는 MCP를 통해 최근 활동을 가져옵니다
         # 현재는 시뮬레이션된 데이터를 반환
         
-        await asyncio.sleep(0.3)
-        
+        await self._simulate_delay(0.3)
+
+        # 조회된 메시지가 있으면 증분 집계된 Counter에서 O(K log K)로 구성
+        if self._activity_ring:
+            return {
+                "period_hours": hours,
+                "total_messages": len(self._activity_ring),
+                "total_threads": len({m.get("threadId") for m in self._activity_ring}),
+                "labels_activity": [
+                    {"label": label, "message_count": count}
+                    for label, count in self._label_counter.most_common(10)
+                    if count > 0
+                ],
+                "top_senders": [
+                    {"email": sender, "message_count": count}
+                    for sender, count in self._sender_counter.most_common(10)
+                    if count > 0
+                ],
+                "trending_topics": _RECENT_ACTIVITY["trending_topics"]
+            }
+
+        return {"period_hours": hours, **_RECENT_ACTIVITY}
+    
+    def _simplify_email(self, index: int, message: Dict[str, Any]) -> Dict[str, Any]:
+        """파싱된 메시지 하나를 저장용 간소화 레코드로 변환합니다."""
+        headers = message.get('parsed_headers', {})
+
+        # 이메일 본문 추출
+        content = ""
+        payload = message.get('payload', {})
+        body = payload.get('body', {})
+
+        if body.get('text'):
+            content = body.get('text', '')
+        elif body.get('html'):
+            # HTML 태그 제거 (C 파서 우선)
+            content = _html_to_text(body.get('html', ''))
+        else:
+            content = message.get('snippet', '')
+
+        # 내용이 너무 길면 자르기 (1000자 제한)
+        if len(content) > 1000:
+            content = content[:1000] + "..."
+
         return {
-            "period_hours": hours,
-            "total_messages": 45,
-            "total_threads": 23,
-            "labels_activity": [
-                {"label": "INBOX", "message_count": 25},
-                {"label": "AI Research", "message_count": 12},
-                {"label": "Conference", "message_count": 8}
-            ],
-            "top_senders": [
-                {"email": "research.team@company.com", "message_count": 8},
-                {"email": "reviewer@journal.com", "message_count": 5},
-                {"email": "registration@icml.cc", "message_count": 3}
-            ],
-            "trending_topics": ["AI Research", "Conference Registration", "Paper Review"]
+            "index": index + 1,
+            "email_id": message.get('id', ''),
+            "from": headers.get('from', '알 수 없음'),
+            "date": headers.get('date', '날짜 없음'),
+            "subject": headers.get('subject', '제목 없음'),
+            "content": content.strip() if content else message.get('snippet', '내용 없음')
         }
-    
+
     async def collect_and_save_simplified_data(self, max_emails: int = 30, output_dir: str = "output/gmail_data") -> Dict[str, Any]:
         """Gmail 데이터를 수집하고 간소화된 형태로 저장합니다."""
         result = {
@@ -480,63 +913,41 @@ class GmailMCP(BaseMCP):
                     result["message"] = "Gmail API 연결 실패"
                     return result
             
-            # 2. 최신 메시지 가져오기
+            # 2. 메시지와 프로필을 동시에 가져오기 (프로필 왕복이 메시지 수집과 겹침)
             self.logger.info(f"최신 {max_emails}개 메시지 수집 중...")
-            messages = await self.get_messages(max_results=max_emails)
-            
+            messages, profile = await asyncio.gather(
+                self.get_messages(max_results=max_emails),
+                self.get_profile_info(),
+                return_exceptions=True
+            )
+
+            if isinstance(messages, Exception):
+                raise messages
+
             if not messages:
                 result["message"] = "메시지를 가져올 수 없음"
                 return result
-            
+
             # 3. 간소화된 데이터 생성
-            simplified_emails = []
-            
+            # 원본 리스트를 제자리에서 변환해 전체 메시지와 간소화 리스트가
+            # 동시에 메모리에 살아있지 않도록 함 (피크 메모리 절반)
             for i, message in enumerate(messages):
-                headers = message.get('parsed_headers', {})
-                
-                # 이메일 본문 추출
-                content = ""
-                payload = message.get('payload', {})
-                body = payload.get('body', {})
-                
-                if body.get('text'):
-                    content = body.get('text', '')
-                elif body.get('html'):
-                    # HTML 태그 제거
-                    html_content = body.get('html', '')
-                    content = re.sub(r'<[^>]+>', '', html_content)
-                    content = re.sub(r'\s+', ' ', content).strip()
-                else:
-                    content = message.get('snippet', '')
-                
-                # 내용이 너무 길면 자르기 (1000자 제한)
-                if len(content) > 1000:
-                    content = content[:1000] + "..."
-                
-                simplified_email = {
-                    "index": i + 1,
-                    "email_id": message.get('id', ''),
-                    "from": headers.get('from', '알 수 없음'),
-                    "date": headers.get('date', '날짜 없음'),
-                    "subject": headers.get('subject', '제목 없음'),
-                    "content": content.strip() if content else message.get('snippet', '내용 없음')
-                }
-                simplified_emails.append(simplified_email)
-            
-            # 4. Gmail 프로필 정보 가져오기 (파일명에 사용)
-            try:
-                profile = await self.get_profile_info()
+                messages[i] = self._simplify_email(i, message)
+            simplified_emails = messages
+
+            # 4. Gmail 프로필 정보 확인 (파일명에 사용, 실패해도 수집은 계속)
+            if isinstance(profile, Exception):
+                self.logger.warning(f"프로필 정보 가져오기 실패, 기본값 사용: {profile}")
+                gmail_id = 'unknown'
+            else:
                 email_address = profile.get('email_address', 'unknown')
                 # 이메일에서 @ 앞부분만 추출하여 파일명으로 사용
                 gmail_id = email_address.split('@')[0] if '@' in email_address else 'unknown'
-            except Exception as e:
-                self.logger.warning(f"프로필 정보 가져오기 실패, 기본값 사용: {e}")
-                gmail_id = 'unknown'
             
             # 5. 간소화된 데이터 구조 생성
             simplified_data = {
                 "collection_info": {
-                    "collection_time": datetime.now().isoformat(),
+                    "collection_time": self._get_current_timestamp(),
                     "total_emails": len(simplified_emails),
                     "max_requested": max_emails,
                     "source": "gmail_mcp",
@@ -551,8 +962,8 @@ class GmailMCP(BaseMCP):
             
             # Gmail ID 기반 파일명으로 저장
             gmail_file = os.path.join(output_dir, f"{gmail_id}_gmail.json")
-            with open(gmail_file, 'w', encoding='utf-8') as f:
-                json.dump(simplified_data, f, ensure_ascii=False, indent=2)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, write_json_file, gmail_file, simplified_data)
             saved_files.append(gmail_file)
             
             # 결과 업데이트
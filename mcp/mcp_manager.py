@@ -1,12 +1,232 @@
 """MCP Manager for coordinating multiple MCP integrations."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
-from .base_mcp import BaseMCP
+import logging
+import re
+import time
+from collections import defaultdict, deque
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Tuple
+from .base_mcp import BaseMCP, _current_timestamp
 from .slack_mcp import SlackMCP
 from .notion_mcp import NotionMCP
 from .gmail_mcp import GmailMCP
 
+log = logging.getLogger(__name__)
+
+# C 기반 멀티 패턴 매칭 (미설치 시 순차 키워드 스캔 폴백)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# 그룹 분류용 키워드 테이블 (우선순위 순서 — 먼저 매칭된 카테고리가 우선)
+_CATEGORY_KEYWORDS: List[Tuple[str, List[str]]] = [
+    ("AI_Research", [
+        "ai", "artificial intelligence", "machine learning", "ml", "deep learning", "dl",
+        "neural network", "신경망", "머신러닝", "딥러닝", "인공지능", "논문", "연구",
+        "optimization", "최적화", "algorithm", "알고리즘", "bert", "gpt", "transformer",
+        "lora", "diffusion", "gan", "cnn", "rnn", "lstm"
+    ]),
+    ("Development_Projects", [
+        "project", "프로젝트", "development", "개발", "implementation", "구현",
+        "code", "코드", "programming", "프로그래밍", "software", "소프트웨어",
+        "repository", "repo", "git", "github", "deployment", "배포",
+        "testing", "테스트", "debug", "디버그", "refactor", "리팩토링"
+    ]),
+    ("Learning_Study", [
+        "study", "학습", "learning", "education", "교육", "course", "강의",
+        "tutorial", "튜토리얼", "workshop", "워크샵", "training", "훈련",
+        "book", "책", "documentation", "문서", "guide", "가이드",
+        "3주차", "4주차", "week", "chapter", "챕터"
+    ]),
+    ("Conference_Events", [
+        "conference", "컨퍼런스", "workshop", "워크샵", "symposium", "심포지엄",
+        "cfp", "call for papers", "submission", "제출", "deadline", "마감",
+        "registration", "등록", "icml", "neurips", "aaai", "ijcai",
+        "presentation", "발표", "poster", "포스터", "demo", "데모"
+    ]),
+    ("Data_Analysis", [
+        "data", "데이터", "dataset", "데이터셋", "analysis", "분석",
+        "statistics", "통계", "visualization", "시각화", "chart", "차트",
+        "graph", "그래프", "table", "테이블", "csv", "json", "xml"
+    ]),
+    ("Collaboration_Communication", [
+        "collaboration", "협업", "team", "팀", "meeting", "미팅", "회의",
+        "discussion", "논의", "chat", "채팅", "communication", "소통",
+        "feedback", "피드백", "review", "리뷰", "comment", "코멘트"
+    ]),
+    ("Planning_Retrospective", [
+        "retrospective", "회고", "planning", "계획", "goal", "목표",
+        "milestone", "마일스톤", "timeline", "타임라인", "schedule", "일정",
+        "progress", "진행", "status", "상태", "update", "업데이트"
+    ]),
+    ("Tools_Technologies", [
+        "tool", "도구", "framework", "프레임워크", "library", "라이브러리",
+        "api", "sdk", "platform", "플랫폼", "service", "서비스",
+        "docker", "kubernetes", "cloud", "클라우드", "aws", "azure"
+    ]),
+]
+
+# 어떤 카테고리에도 매칭되지 않을 때의 기본 그룹
+_DEFAULT_CATEGORY = "General_Discussion"
+
+# 폴백 분류기용 토크나이저 (영숫자 + 한글)
+_TOKEN_RE = re.compile(r"[\w가-힣]+", re.UNICODE)
+
+
+def _extract_text(item: Dict[str, Any]) -> str:
+    """분류 대상 아이템에서 텍스트를 추출합니다."""
+    source = item.get("source")
+    if source == "slack":
+        return item.get("content", "")
+    if source == "notion":
+        return item.get("title", "")
+    if source == "gmail":
+        return f"{item.get('subject', '')} {item.get('snippet', '')}"
+    return ""
+
+# 폴백 경로용 사전 분해: 단일 토큰은 frozenset 교집합으로, 공백 포함
+# 구문("call for papers" 등)만 잔여 부분 문자열 검사로 매칭
+_CATEGORY_MATCHERS: List[Tuple[str, frozenset, Tuple[str, ...]]] = [
+    (
+        category,
+        frozenset(kw for kw in keywords if " " not in kw),
+        tuple(kw for kw in keywords if " " in kw),
+    )
+    for category, keywords in _CATEGORY_KEYWORDS
+]
+
+
+# 스트리밍 소비자에게 프로듀서 종료를 알리는 센티널
+_STREAM_DONE = object()
+
+# Slack 연결 실패 시 반환하는 폴백 페이로드 (호출마다 리터럴을 새로
+# 조립하지 않도록 모듈 로드 시 한 번만 생성; 반환 시 최상위만 복사)
+_FALLBACK_SLACK_INFO: Dict[str, Any] = {
+    "workspace_info": {
+        "workspace_name": "AI Research Team (Fallback)",
+        "member_count": 25,
+        "status": "fallback"
+    },
+    "channels": [
+        {
+            "name": "research-discussion",
+            "topic": "AI 연구 논의 및 아이디어 공유",
+            "member_count": 15
+        }
+    ],
+    "recent_activity": {
+        "total_messages": 45,
+        "active_channels": 3,
+        "trending_topics": ["AI 최적화", "동적 배칭", "머신러닝 성능"]
+    },
+    "all_channel_messages": {},
+    "total_message_count": 0,
+    "ai_research_messages": [
+        {
+            "text": "AI 최적화 알고리즘에 대한 논의가 정말 흥미로웠어요.",
+            "channel": "research-discussion",
+            "timestamp": "2024-08-16T09:30:00Z"
+        }
+    ],
+    "connection_status": False
+}
+
+
+def _iter_slack_items(slack_data: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Slack 수집 결과를 분류용 아이템으로 하나씩 내보냅니다."""
+    if not slack_data or slack_data.get("connection_status") is False:
+        return
+    for channel_name, messages in slack_data.get("all_channel_messages", {}).items():
+        for msg in messages:
+            yield {
+                "source": "slack",
+                "channel": channel_name,
+                "content": msg.get("text", ""),
+                "timestamp": msg.get("timestamp", ""),
+                "type": "message"
+            }
+
+
+def _iter_notion_items(notion_data: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Notion 수집 결과를 분류용 아이템으로 하나씩 내보냅니다."""
+    if not notion_data or notion_data.get("connection_status") is False:
+        return
+    for page in notion_data.get("all_pages", []):
+        yield {
+            "source": "notion",
+            "title": page.get("title", ""),
+            "content_count": len(page.get("content", [])),
+            "last_edited": page.get("last_edited", ""),
+            "type": "page"
+        }
+
+
+def _iter_gmail_items(gmail_data: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Gmail 수집 결과를 분류용 아이템으로 하나씩 내보냅니다."""
+    if not gmail_data or gmail_data.get("connection_status") is False:
+        return
+    for msg in gmail_data.get("all_messages", []):
+        yield {
+            "source": "gmail",
+            "subject": msg.get("subject", msg.get("snippet", "")),
+            "snippet": msg.get("snippet", ""),
+            "timestamp": msg.get("timestamp", ""),
+            "type": "email"
+        }
+
+
+class _CircuitBreaker:
+    """롤링 윈도우 기반의 간단한 서킷 브레이커.
+
+    샘플링 윈도우 내 실패 비율이 임계치를 넘으면 break_duration 동안
+    열리고(OPEN), 그 뒤 첫 호출 한 번을 반개방(HALF_OPEN)으로 통과시켜
+    복구 여부를 확인합니다.
+    """
+
+    def __init__(self, failure_threshold: float = 0.5, minimum_throughput: int = 3,
+                 sampling_duration: float = 30.0, break_duration: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.minimum_throughput = minimum_throughput
+        self.sampling_duration = sampling_duration
+        self.break_duration = break_duration
+        self._events: deque = deque()  # (단조 시각, 성공 여부)
+        self._opened_at: Optional[float] = None
+
+    def _prune(self, now: float) -> None:
+        """샘플링 윈도우를 벗어난 기록을 제거합니다."""
+        while self._events and now - self._events[0][0] > self.sampling_duration:
+            self._events.popleft()
+
+    def is_open(self) -> bool:
+        """호출을 차단해야 하는지 확인합니다."""
+        if self._opened_at is None:
+            return False
+        if time.monotonic() - self._opened_at < self.break_duration:
+            return True
+        # HALF_OPEN: 차단 기간이 지나면 한 번의 시도를 허용
+        self._opened_at = None
+        self._events.clear()
+        return False
+
+    def record_success(self) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self._events.append((now, True))
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self._events.append((now, False))
+
+        failures = sum(1 for _, ok in self._events if not ok)
+        if (len(self._events) >= self.minimum_throughput
+                and failures / len(self._events) >= self.failure_threshold):
+            self._opened_at = now
+
 
 class MCPManager:
     """여러 MCP 통합을 조정하는 매니저 클래스."""
@@ -15,9 +235,58 @@ class MCPManager:
         self.config = config or {}
         self.integrations: Dict[str, BaseMCP] = {}
         self.connection_status: Dict[str, str] = {}
-        
+
+        # 원격 호출별 타임아웃 예산 (초) — 한 통합이 멈춰도 전체 수집이 정지하지 않음
+        timeouts = self.config.get("timeouts", {})
+        self._timeouts = {
+            "connect": timeouts.get("connect", 5),
+            "health": timeouts.get("health", 5),
+            "fetch": timeouts.get("fetch", 120),
+        }
+
+        # 분류 자동자 구축 (전체 키워드를 텍스트 1회 스캔으로 매칭)
+        self._classifier = self._build_classifier()
+
         # 기본 통합 초기화
         self._initialize_integrations()
+
+        # get_*_info 결과 TTL 캐시: key → (저장 시각, 수집 태스크)
+        # 동시 호출자는 진행 중인 태스크 하나를 공유 (single-flight)
+        self._info_cache: Dict[str, Tuple[float, asyncio.Task]] = {}
+        self._info_cache_ttl = self.config.get("info_cache_ttl", 300.0)
+
+        # 유휴 구간에도 HTTP 세션/커넥션 풀을 따뜻하게 유지하는 하트비트
+        # (0 이하로 설정하면 비활성화)
+        self._keepalive_interval = self.config.get("keepalive_interval", 45.0)
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+        # 통합별 서킷 브레이커 (연속 실패 시 타임아웃 예산을 태우지 않고 즉시 폴백)
+        breaker_config = self.config.get("circuit_breaker", {})
+        self._breakers = {
+            name: _CircuitBreaker(
+                failure_threshold=breaker_config.get("failure_threshold", 0.5),
+                minimum_throughput=breaker_config.get("minimum_throughput", 3),
+                sampling_duration=breaker_config.get("sampling_duration", 30.0),
+                break_duration=breaker_config.get("break_duration", 60.0),
+            )
+            for name in self.integrations
+        }
+
+    @staticmethod
+    def _build_classifier():
+        """키워드 테이블로 Aho-Corasick 자동자를 구축합니다 (미설치 시 None)."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for priority, (category, keywords) in enumerate(_CATEGORY_KEYWORDS):
+            for keyword in keywords:
+                existing = automaton.get(keyword, None)
+                # 같은 키워드가 여러 카테고리에 있으면 우선순위 높은 쪽 유지
+                if existing is None or priority < existing[0]:
+                    automaton.add_word(keyword, (priority, category))
+        automaton.make_automaton()
+        return automaton
     
     def _initialize_integrations(self):
         """MCP 통합들을 초기화합니다."""
@@ -32,224 +301,361 @@ class MCPManager:
         # Gmail 통합
         gmail_config = self.config.get("gmail", {})
         self.integrations["gmail"] = GmailMCP(gmail_config)
+
+        # 자주 쓰는 통합은 속성으로도 바인딩 (호출마다 dict 조회 제거)
+        self.slack = self.integrations["slack"]
+        self.notion = self.integrations["notion"]
+        self.gmail = self.integrations["gmail"]
     
+    async def _cached_info(self, key: str, fetch) -> Dict[str, Any]:
+        """get_*_info 결과를 TTL 동안 캐시합니다 (동시 호출은 한 수집을 공유)."""
+        loop = asyncio.get_running_loop()
+        entry = self._info_cache.get(key)
+        if entry and loop.time() - entry[0] < self._info_cache_ttl:
+            return await entry[1]
+
+        task = asyncio.ensure_future(fetch())
+        self._info_cache[key] = (loop.time(), task)
+        try:
+            result = await task
+        except Exception:
+            # 실패한 수집은 캐시에서 제거하여 다음 호출이 재시도하게 함
+            self._info_cache.pop(key, None)
+            raise
+
+        # 폴백 결과는 캐시하지 않아 통합이 복구되면 바로 반영되게 함
+        if result.get("connection_status") is False:
+            self._info_cache.pop(key, None)
+        return result
+
+    async def _with_timeout(self, coro, budget: str):
+        """코루틴 하나에만 타임아웃을 적용합니다 (gather 형제 태스크는 취소하지 않음)."""
+        async with asyncio.timeout(self._timeouts[budget]):
+            return await coro
+
     async def connect_all(self) -> Dict[str, bool]:
-        """모든 MCP 통합에 연결합니다."""
+        """모든 MCP 통합에 동시에 연결합니다 (전체 소요 시간 = 가장 느린 통합)."""
+        names = list(self.integrations)
+        raw = await asyncio.gather(
+            *(self._with_timeout(self.integrations[name].connect(), "connect") for name in names),
+            return_exceptions=True
+        )
+
         results = {}
-        
-        for name, integration in self.integrations.items():
-            try:
-                success = await integration.connect()
-                results[name] = success
-                self.connection_status[name] = "connected" if success else "failed"
-            except Exception as e:
+        for name, outcome in zip(names, raw):
+            if isinstance(outcome, Exception):
                 results[name] = False
                 self.connection_status[name] = "failed"
-                print(f"Failed to connect to {name}: {e}")
-        
+                log.warning("Failed to connect to %s: %s", name, outcome)
+            else:
+                results[name] = outcome
+                self.connection_status[name] = "connected" if outcome else "failed"
+
+        # 연결 후 하트비트 시작 — 유휴 시 TLS/커넥션이 끊기지 않게 유지
+        if (self._keepalive_interval > 0
+                and (self._keepalive_task is None or self._keepalive_task.done())
+                and any(results.values())):
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
         return results
-    
+
+    async def _keepalive_loop(self) -> None:
+        """연결된 통합에 주기적으로 가벼운 점검을 보내 세션을 유지합니다.
+
+        각 클라이언트(AsyncWebClient, AuthorizedHttp 등)는 프로세스
+        수명 동안 재사용되므로, 유휴 구간에 원격/중간 장비가 커넥션을
+        닫아 다음 호출이 TLS 핸드셰이크를 다시 치르는 일을 막습니다.
+        """
+        while True:
+            await asyncio.sleep(self._keepalive_interval)
+            for name, integration in self.integrations.items():
+                if self.connection_status.get(name) != "connected":
+                    continue
+                try:
+                    alive = await self._with_timeout(integration.is_connected(), "health")
+                except Exception as e:
+                    alive = False
+                    log.warning("Keepalive probe failed for %s: %s", name, e)
+                if not alive:
+                    # 끊긴 세션은 표시만 해 두고, 다음 호출이
+                    # execute_with_retry의 재연결 경로를 타게 한다
+                    self.connection_status[name] = "failed"
+
     async def disconnect_all(self) -> Dict[str, bool]:
-        """모든 MCP 통합 연결을 해제합니다."""
+        """모든 MCP 통합 연결을 동시에 해제합니다."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
+        names = list(self.integrations)
+        raw = await asyncio.gather(
+            *(self.integrations[name].disconnect() for name in names),
+            return_exceptions=True
+        )
+
         results = {}
-        
-        for name, integration in self.integrations.items():
-            try:
-                success = await integration.disconnect()
-                results[name] = success
-                self.connection_status[name] = "disconnected" if success else "failed"
-            except Exception as e:
+        for name, outcome in zip(names, raw):
+            if isinstance(outcome, Exception):
                 results[name] = False
-                print(f"Failed to disconnect from {name}: {e}")
-        
+                log.warning("Failed to disconnect from %s: %s", name, outcome)
+            else:
+                results[name] = outcome
+                self.connection_status[name] = "disconnected" if outcome else "failed"
+
         return results
-    
+
     async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
-        """모든 MCP 통합의 상태를 확인합니다."""
+        """모든 MCP 통합의 상태를 동시에 확인합니다."""
+        names = list(self.integrations)
+        raw = await asyncio.gather(
+            *(self._with_timeout(self.integrations[name].health_check(), "health") for name in names),
+            return_exceptions=True
+        )
+
         results = {}
-        
-        for name, integration in self.integrations.items():
-            try:
-                health = await integration.health_check()
-                results[name] = health
-            except Exception as e:
+        for name, outcome in zip(names, raw):
+            if isinstance(outcome, Exception):
                 results[name] = {
                     "status": "error",
-                    "message": f"Health check failed: {str(e)}",
+                    "message": f"Health check failed: {str(outcome)}",
                     "timestamp": self._get_current_timestamp()
                 }
-        
+            else:
+                results[name] = outcome
+
         return results
     
+    async def _search_keywords(self, integration: BaseMCP, keywords: List[str]) -> List[Dict[str, Any]]:
+        """키워드 목록으로 메시지를 검색합니다.
+
+        백엔드가 OR 구문을 지원하면 단일 OR 쿼리로 K회 왕복을 1회로 줄이고,
+        지원하지 않으면 키워드별 검색을 동시에 실행합니다.
+        """
+        if integration.supports_or_query:
+            or_query = " OR ".join(f'"{keyword}"' for keyword in keywords)
+            try:
+                # 서버가 중복 없이 한 번에 반환하므로 후속 dedup도 필요 없음
+                return list(await integration.search_messages(or_query))
+            except Exception as e:
+                log.warning("OR 쿼리 검색 실패, 키워드별 검색으로 폴백: %s", e)
+
+        messages: List[Dict[str, Any]] = []
+        search_results = await asyncio.gather(
+            *(integration.search_messages(keyword) for keyword in keywords),
+            return_exceptions=True
+        )
+        for keyword, keyword_messages in zip(keywords, search_results):
+            if isinstance(keyword_messages, Exception):
+                log.warning("키워드 '%s' 검색 실패: %s", keyword, keyword_messages)
+                continue
+            messages.extend(keyword_messages)
+        return messages
+
     def get_integration(self, name: str) -> Optional[BaseMCP]:
         """지정된 이름의 MCP 통합을 반환합니다."""
         return self.integrations.get(name)
     
-    def get_connection_status(self) -> Dict[str, str]:
-        """모든 통합의 연결 상태를 반환합니다."""
-        return self.connection_status.copy()
+    def get_connection_status(self) -> Mapping[str, str]:
+        """모든 통합의 연결 상태를 읽기 전용 뷰로 반환합니다."""
+        # copy() 대신 O(1) 읽기 전용 프록시 — 호출자 쪽 변경은 차단되고
+        # 매니저 내부 갱신은 뷰에 그대로 반영됨
+        return MappingProxyType(self.connection_status)
     
     async def is_any_connected(self) -> bool:
-        """하나라도 연결된 통합이 있는지 확인합니다."""
-        for integration in self.integrations.values():
-            if await integration.is_connected():
-                return True
-        return False
+        """하나라도 연결된 통합이 있는지 확인합니다.
+
+        모든 점검을 동시에 시작하고 가장 먼저 True가 나오는 순간
+        나머지를 취소합니다 (순차 합산 대기 대신 비동기 short-circuit any).
+        """
+        tasks = {
+            asyncio.create_task(integration.is_connected())
+            for integration in self.integrations.values()
+        }
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        if task.result():
+                            return True
+                    except Exception as e:
+                        log.debug("Connectivity probe failed: %s", e)
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
     
     # Slack 관련 메서드들
     async def get_slack_info(self) -> Dict[str, Any]:
-        """Slack 정보를 가져옵니다."""
-        slack_integration = self.integrations.get("slack")
+        """Slack 정보를 가져옵니다 (TTL 내 반복 호출은 캐시된 결과 반환)."""
+        return await self._cached_info("slack", self._get_slack_info_uncached)
+
+    async def _get_slack_info_uncached(self) -> Dict[str, Any]:
+        """Slack 정보 수집 진입점 (브레이커/타임아웃/폴백 처리)."""
+        slack_integration = self.slack
         if not slack_integration:
             raise ValueError("Slack integration not available")
-        
+
+        # 반복 실패 중이면 타임아웃 예산을 태우지 않고 즉시 폴백
+        breaker = self._breakers["slack"]
+        if breaker.is_open():
+            log.warning("Slack 서킷 브레이커 개방 - 폴백 데이터 반환")
+            return self._get_fallback_slack_info()
+
         try:
-            # 워크스페이스 정보
-            workspace_info = await slack_integration.get_workspace_info()
-            
-            # 채널 정보 (전체)
-            channels = await slack_integration.get_channels(include_private=True)
-            
-            # 최근 활동 (전체)
-            recent_activity = await slack_integration.get_recent_activity(hours=168)  # 1주일
-            
-            # 모든 채널의 메시지 수집 (전체 범위)
-            all_messages = {}
-            total_message_count = 0
-            
-            for channel in channels:
-                try:
-                    # 각 채널의 메시지를 최대한 수집 (Slack API 제한 고려)
-                    messages = await slack_integration.get_channel_messages(channel["id"], limit=1000)
-                    all_messages[channel["name"]] = messages
-                    total_message_count += len(messages)
-                except Exception as e:
-                    print(f"채널 {channel['name']} 메시지 수집 실패: {e}")
-                    all_messages[channel["name"]] = []
-            
-            # AI 연구 관련 메시지 검색 (키워드 확장)
-            ai_keywords = ["AI", "research", "optimization", "machine learning", "deep learning", "논문", "연구", "최적화"]
-            ai_messages = []
-            
-            for keyword in ai_keywords:
-                try:
-                    keyword_messages = await slack_integration.search_messages(keyword)
-                    ai_messages.extend(keyword_messages)
-                except Exception as e:
-                    print(f"키워드 '{keyword}' 검색 실패: {e}")
-                    continue
-            
-            # 중복 제거
-            unique_ai_messages = []
-            seen_ids = set()
-            for msg in ai_messages:
-                if msg.get("id") not in seen_ids:
-                    unique_ai_messages.append(msg)
-                    seen_ids.add(msg.get("id"))
-            
-            return {
-                "workspace_info": workspace_info,
-                "channels": channels,
-                "recent_activity": recent_activity,
-                "all_channel_messages": all_messages,
-                "total_message_count": total_message_count,
-                "ai_research_messages": unique_ai_messages,
-                "connection_status": await slack_integration.is_connected()
-            }
-            
+            # fetch 예산 내에 수집을 마치지 못하면 폴백으로 전환
+            result = await self._with_timeout(self._collect_slack_info(slack_integration), "fetch")
+            breaker.record_success()
+            return result
         except Exception as e:
-            print(f"Failed to get Slack info: {e}")
+            breaker.record_failure()
+            log.warning("Failed to get Slack info: %s", e)
             # 폴백 데이터 반환
             return self._get_fallback_slack_info()
+
+    async def _collect_slack_info(self, slack_integration: BaseMCP) -> Dict[str, Any]:
+        """Slack 수집의 실제 구현 (타임아웃/폴백은 get_slack_info에서 처리)."""
+        # 독립적인 최상위 조회를 한 번의 gather로 동시 실행
+        workspace_info, channels, recent_activity, connected = await asyncio.gather(
+            slack_integration.get_workspace_info(),
+            slack_integration.get_channels(include_private=True),
+            slack_integration.get_recent_activity(hours=168),  # 1주일
+            slack_integration.is_connected()
+        )
+
+        # 모든 채널의 메시지 수집 (전체 범위)
+        # 채널별 조회를 세마포어로 제한된 동시 실행으로 겹침 (Slack 레이트 리밋 고려)
+        all_messages = {}
+        total_message_count = 0
+
+        sem = asyncio.Semaphore(self.config.get("slack", {}).get("max_concurrency", 5))
+
+        async def fetch_channel(channel):
+            async with sem:
+                # 각 채널의 메시지를 최대한 수집 (Slack API 제한 고려)
+                return await slack_integration.get_channel_messages(channel["id"], limit=1000)
+
+        # 채널 메시지 수집과 키워드 검색은 서로 독립이므로 함께 겹침
+        ai_keywords = ["AI", "research", "optimization", "machine learning", "deep learning", "논문", "연구", "최적화"]
+        channel_results, ai_messages = await asyncio.gather(
+            asyncio.gather(*(fetch_channel(channel) for channel in channels), return_exceptions=True),
+            self._search_keywords(slack_integration, ai_keywords)
+        )
+        for channel, messages in zip(channels, channel_results):
+            if isinstance(messages, Exception):
+                log.warning("채널 %s 메시지 수집 실패: %s", channel["name"], messages)
+                all_messages[channel["name"]] = []
+                continue
+            all_messages[channel["name"]] = messages
+            total_message_count += len(messages)
+
+        # 중복 제거 (id 키 dict 빌드 한 번으로 C 레벨 dedup, 삽입 순서 유지)
+        unique_ai_messages = list({m.get("id"): m for m in ai_messages if m.get("id")}.values())
+
+        return {
+            "workspace_info": workspace_info,
+            "channels": channels,
+            "recent_activity": recent_activity,
+            "all_channel_messages": all_messages,
+            "total_message_count": total_message_count,
+            "ai_research_messages": unique_ai_messages,
+            "connection_status": connected
+        }
     
     def _get_fallback_slack_info(self) -> Dict[str, Any]:
         """Slack 연결 실패 시 사용할 폴백 데이터를 반환합니다."""
-        return {
-            "workspace_info": {
-                "workspace_name": "AI Research Team (Fallback)",
-                "member_count": 25,
-                "status": "fallback"
-            },
-            "channels": [
-                {
-                    "name": "research-discussion",
-                    "topic": "AI 연구 논의 및 아이디어 공유",
-                    "member_count": 15
-                }
-            ],
-            "recent_activity": {
-                "total_messages": 45,
-                "active_channels": 3,
-                "trending_topics": ["AI 최적화", "동적 배칭", "머신러닝 성능"]
-            },
-            "all_channel_messages": {},
-            "total_message_count": 0,
-            "ai_research_messages": [
-                {
-                    "text": "AI 최적화 알고리즘에 대한 논의가 정말 흥미로웠어요.",
-                    "channel": "research-discussion",
-                    "timestamp": "2024-08-16T09:30:00Z"
-                }
-            ],
-            "connection_status": False
-        }
+        # 소비자는 읽기만 하므로 최상위 얕은 복사로 충분
+        return dict(_FALLBACK_SLACK_INFO)
     
     # Notion 관련 메서드들
     async def get_notion_info(self) -> Dict[str, Any]:
-        """Notion 정보를 가져옵니다."""
-        notion_integration = self.integrations.get("notion")
+        """Notion 정보를 가져옵니다 (TTL 내 반복 호출은 캐시된 결과 반환)."""
+        return await self._cached_info("notion", self._get_notion_info_uncached)
+
+    async def _get_notion_info_uncached(self) -> Dict[str, Any]:
+        """Notion 정보 수집 진입점 (브레이커/타임아웃/폴백 처리)."""
+        notion_integration = self.notion
         if not notion_integration:
             raise ValueError("Notion integration not available")
-        
+
+        # 반복 실패 중이면 타임아웃 예산을 태우지 않고 즉시 폴백
+        breaker = self._breakers["notion"]
+        if breaker.is_open():
+            log.warning("Notion 서킷 브레이커 개방 - 폴백 데이터 반환")
+            return self._get_fallback_notion_info()
+
         try:
-            # 워크스페이스 정보
-            workspace_info = await notion_integration.get_workspace_info()
-            
-            # 데이터베이스 정보 (전체)
-            databases = await notion_integration.get_databases()
-            
-            # 각 데이터베이스의 모든 항목 수집 (전체 범위)
-            for db in databases:
-                try:
-                    entries = await notion_integration.get_database_entries(db['id'])
-                    db['entries'] = entries  # 전체 항목 포함
-                    print(f"데이터베이스 '{db.get('title', 'Unknown')}': {len(entries)}개 항목 수집")
-                except Exception as e:
-                    print(f"데이터베이스 '{db.get('title', 'Unknown')}' 항목 수집 실패: {e}")
-                    db['entries'] = []
-            
-            # 전체 페이지 검색 (키워드 제한 없음)
-            all_pages = await notion_integration.search_pages("", None)
-            
-            # 각 페이지의 전체 내용 수집
-            pages_with_content = []
-            for page in all_pages:
-                try:
-                    page_content = await notion_integration.get_page_content(page['id'])
-                    pages_with_content.append(page_content)
-                    print(f"페이지 '{page_content.get('title', 'Unknown')}': {len(page_content.get('content', []))}개 블록")
-                except Exception as e:
-                    print(f"페이지 '{page.get('title', 'Unknown')}' 내용 수집 실패: {e}")
-                    continue
-            
-            # 최근 변경사항 (전체)
-            recent_changes = await notion_integration.get_recent_changes(hours=168)  # 1주일
-            
-            return {
-                "workspace_info": workspace_info,
-                "databases": databases,
-                "total_databases": len(databases),
-                "total_database_entries": sum(len(db.get('entries', [])) for db in databases),
-                "all_pages": pages_with_content,
-                "total_pages": len(pages_with_content),
-                "recent_changes": recent_changes,
-                "connection_status": await notion_integration.is_connected()
-            }
-            
+            # fetch 예산 내에 수집을 마치지 못하면 폴백으로 전환
+            result = await self._with_timeout(self._collect_notion_info(notion_integration), "fetch")
+            breaker.record_success()
+            return result
         except Exception as e:
-            print(f"Failed to get Notion info: {e}")
+            breaker.record_failure()
+            log.warning("Failed to get Notion info: %s", e)
             # 폴백 데이터 반환
             return self._get_fallback_notion_info()
+
+    async def _collect_notion_info(self, notion_integration: BaseMCP) -> Dict[str, Any]:
+        """Notion 수집의 실제 구현 (타임아웃/폴백은 get_notion_info에서 처리)."""
+        # 독립적인 최상위 조회를 한 번의 gather로 동시 실행
+        workspace_info, databases, all_pages, recent_changes, connected = await asyncio.gather(
+            notion_integration.get_workspace_info(),
+            notion_integration.get_databases(),
+            notion_integration.search_pages("", None),
+            notion_integration.get_recent_changes(hours=168),  # 1주일
+            notion_integration.is_connected()
+        )
+
+        # Notion 레이트 리밋을 넘지 않는 선에서 항목/내용 조회를 겹침
+        sem = asyncio.Semaphore(self.config.get("notion", {}).get("max_concurrency", 4))
+
+        async def fetch_entries(db):
+            async with sem:
+                return await notion_integration.get_database_entries(db['id'])
+
+        async def fetch_page_content(page):
+            async with sem:
+                return await notion_integration.get_page_content(page['id'])
+
+        # 각 데이터베이스의 모든 항목 수집 (전체 범위)
+        # 총 항목 수는 수집 루프 안에서 바로 누적 (별도 sum 패스 제거)
+        total_database_entries = 0
+        entry_results = await asyncio.gather(
+            *(fetch_entries(db) for db in databases),
+            return_exceptions=True
+        )
+        for db, entries in zip(databases, entry_results):
+            if isinstance(entries, Exception):
+                log.warning("데이터베이스 '%s' 항목 수집 실패: %s", db.get("title", "Unknown"), entries)
+                db['entries'] = []
+                continue
+            db['entries'] = entries  # 전체 항목 포함
+            total_database_entries += len(entries)
+            log.debug("데이터베이스 '%s': %d개 항목 수집", db.get("title", "Unknown"), len(entries))
+
+        # 각 페이지의 전체 내용 수집
+        pages_with_content = []
+        content_results = await asyncio.gather(
+            *(fetch_page_content(page) for page in all_pages),
+            return_exceptions=True
+        )
+        for page, page_content in zip(all_pages, content_results):
+            if isinstance(page_content, Exception):
+                log.warning("페이지 '%s' 내용 수집 실패: %s", page.get("title", "Unknown"), page_content)
+                continue
+            pages_with_content.append(page_content)
+            log.debug("페이지 '%s': %d개 블록", page_content.get("title", "Unknown"), len(page_content.get("content", [])))
+
+        return {
+            "workspace_info": workspace_info,
+            "databases": databases,
+            "total_databases": len(databases),
+            "total_database_entries": total_database_entries,
+            "all_pages": pages_with_content,
+            "total_pages": len(pages_with_content),
+            "recent_changes": recent_changes,
+            "connection_status": connected
+        }
     
     def _get_fallback_notion_info(self) -> Dict[str, Any]:
         """Notion 연결 실패 시 사용할 폴백 데이터를 반환합니다."""
@@ -288,80 +694,65 @@ class MCPManager:
     
     # Gmail 관련 메서드들
     async def get_gmail_info(self) -> Dict[str, Any]:
-        """Gmail 정보를 가져옵니다."""
-        gmail_integration = self.integrations.get("gmail")
+        """Gmail 정보를 가져옵니다 (TTL 내 반복 호출은 캐시된 결과 반환)."""
+        return await self._cached_info("gmail", self._get_gmail_info_uncached)
+
+    async def _get_gmail_info_uncached(self) -> Dict[str, Any]:
+        """Gmail 정보 수집 진입점 (브레이커/타임아웃/폴백 처리)."""
+        gmail_integration = self.gmail
         if not gmail_integration:
             raise ValueError("Gmail integration not available")
-        
+
+        # 반복 실패 중이면 타임아웃 예산을 태우지 않고 즉시 폴백
+        breaker = self._breakers["gmail"]
+        if breaker.is_open():
+            log.warning("Gmail 서킷 브레이커 개방 - 폴백 데이터 반환")
+            return self._get_fallback_gmail_info()
+
         try:
-            # 프로필 정보
-            profile_info = await gmail_integration.get_profile_info()
-            
-            # 라벨 정보 (전체)
-            labels = await gmail_integration.get_labels()
-            
-            # 전체 메시지 수집 (최근 1000개)
-            all_messages = await gmail_integration.get_messages(limit=1000)
-            
-            # AI 연구 관련 메시지 검색 (키워드 확장)
-            ai_keywords = ["AI", "research", "machine learning", "deep learning", "논문", "연구", "최적화", "conference", "paper"]
-            ai_messages = []
-            
-            for keyword in ai_keywords:
-                try:
-                    keyword_messages = await gmail_integration.search_messages(keyword)
-                    ai_messages.extend(keyword_messages)
-                except Exception as e:
-                    print(f"키워드 '{keyword}' 검색 실패: {e}")
-                    continue
-            
-            # 컨퍼런스 관련 메시지 검색 (키워드 확장)
-            conference_keywords = ["conference", "workshop", "symposium", "컨퍼런스", "워크샵", "심포지엄", "deadline", "submission", "CFP"]
-            conference_messages = []
-            
-            for keyword in conference_keywords:
-                try:
-                    keyword_messages = await gmail_integration.search_messages(keyword)
-                    conference_messages.extend(keyword_messages)
-                except Exception as e:
-                    print(f"키워드 '{keyword}' 검색 실패: {e}")
-                    continue
-            
-            # 중복 제거
-            unique_ai_messages = []
-            unique_conference_messages = []
-            seen_ai_ids = set()
-            seen_conf_ids = set()
-            
-            for msg in ai_messages:
-                if msg.get("id") not in seen_ai_ids:
-                    unique_ai_messages.append(msg)
-                    seen_ai_ids.add(msg.get("id"))
-            
-            for msg in conference_messages:
-                if msg.get("id") not in seen_conf_ids:
-                    unique_conference_messages.append(msg)
-                    seen_conf_ids.add(msg.get("id"))
-            
-            # 최근 활동 (전체)
-            recent_activity = await gmail_integration.get_recent_activity()
-            
-            return {
-                "profile_info": profile_info,
-                "labels": labels,
-                "total_labels": len(labels),
-                "all_messages": all_messages,
-                "total_messages": len(all_messages),
-                "ai_research_messages": unique_ai_messages,
-                "conference_messages": unique_conference_messages,
-                "recent_activity": recent_activity,
-                "connection_status": await gmail_integration.is_connected()
-            }
-            
+            # fetch 예산 내에 수집을 마치지 못하면 폴백으로 전환
+            result = await self._with_timeout(self._collect_gmail_info(gmail_integration), "fetch")
+            breaker.record_success()
+            return result
         except Exception as e:
-            print(f"Failed to get Gmail info: {e}")
+            breaker.record_failure()
+            log.warning("Failed to get Gmail info: %s", e)
             # 폴백 데이터 반환
             return self._get_fallback_gmail_info()
+
+    async def _collect_gmail_info(self, gmail_integration: BaseMCP) -> Dict[str, Any]:
+        """Gmail 수집의 실제 구현 (타임아웃/폴백은 get_gmail_info에서 처리)."""
+        # 독립적인 조회 전체를 한 번의 gather로 동시 실행
+        # (프로필/라벨/최근 활동 왕복이 대량 메시지 수집 뒤에 숨음)
+        ai_keywords = ["AI", "research", "machine learning", "deep learning", "논문", "연구", "최적화", "conference", "paper"]
+        conference_keywords = ["conference", "workshop", "symposium", "컨퍼런스", "워크샵", "심포지엄", "deadline", "submission", "CFP"]
+
+        (profile_info, labels, all_messages, recent_activity, connected,
+         ai_messages, conference_messages) = await asyncio.gather(
+            gmail_integration.get_profile_info(),
+            gmail_integration.get_labels(),
+            gmail_integration.get_messages(max_results=1000),  # 전체 메시지 수집 (최근 1000개)
+            gmail_integration.get_recent_activity(),
+            gmail_integration.is_connected(),
+            self._search_keywords(gmail_integration, ai_keywords),
+            self._search_keywords(gmail_integration, conference_keywords)
+        )
+
+        # 중복 제거 (id 키 dict 빌드 한 번으로 C 레벨 dedup, 삽입 순서 유지)
+        unique_ai_messages = list({m.get("id"): m for m in ai_messages if m.get("id")}.values())
+        unique_conference_messages = list({m.get("id"): m for m in conference_messages if m.get("id")}.values())
+
+        return {
+            "profile_info": profile_info,
+            "labels": labels,
+            "total_labels": len(labels),
+            "all_messages": all_messages,
+            "total_messages": len(all_messages),
+            "ai_research_messages": unique_ai_messages,
+            "conference_messages": unique_conference_messages,
+            "recent_activity": recent_activity,
+            "connection_status": connected
+        }
     
     def _get_fallback_gmail_info(self) -> Dict[str, Any]:
         """Gmail 연결 실패 시 사용할 폴백 데이터를 반환합니다."""
@@ -425,7 +816,7 @@ class MCPManager:
             }
             
         except Exception as e:
-            print(f"Failed to get all info: {e}")
+            log.error("Failed to get all info: %s", e)
             return {
                 "error": f"Failed to collect information: {str(e)}",
                 "overall_status": {
@@ -437,174 +828,128 @@ class MCPManager:
     
     def _get_current_timestamp(self) -> str:
         """현재 타임스탬프를 반환합니다."""
-        import datetime
-        return datetime.datetime.now().isoformat()
+        return _current_timestamp()
     
     def get_summary(self) -> Dict[str, Any]:
         """MCP 매니저의 요약 정보를 반환합니다."""
         return {
             "total_integrations": len(self.integrations),
             "integration_names": list(self.integrations.keys()),
-            "connection_status": self.connection_status,
+            "connection_status": MappingProxyType(self.connection_status),
             "config_keys": list(self.config.keys()) if self.config else []
         }
     
     def group_by_titles(self, slack_data: Dict[str, Any], notion_data: Dict[str, Any], gmail_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
         """제목 기반으로 데이터를 동적으로 그룹화합니다."""
-        # 모든 데이터를 수집
-        all_items = []
-        
-        # Slack 메시지 전체 추가
-        if slack_data and slack_data.get("connection_status") is not False:
-            slack_messages = slack_data.get("all_channel_messages", {})
-            for channel_name, messages in slack_messages.items():
-                for msg in messages:
-                    all_items.append({
-                        "source": "slack",
-                        "channel": channel_name,
-                        "content": msg.get("text", ""),
-                        "timestamp": msg.get("timestamp", ""),
-                        "type": "message"
-                    })
-        
-        # Notion 페이지 제목 추가
-        if notion_data and notion_data.get("connection_status") is not False:
-            pages = notion_data.get("all_pages", [])
-            for page in pages:
-                title = page.get("title", "")
-                all_items.append({
-                    "source": "notion",
-                    "title": title,
-                    "content_count": len(page.get("content", [])),
-                    "last_edited": page.get("last_edited", ""),
-                    "type": "page"
-                })
-        
-        # Gmail 메시지 제목 추가
-        if gmail_data and gmail_data.get("connection_status") is not False:
-            messages = gmail_data.get("all_messages", [])
-            for msg in messages:
-                subject = msg.get("subject", msg.get("snippet", ""))
-                all_items.append({
-                    "source": "gmail",
-                    "subject": subject,
-                    "snippet": msg.get("snippet", ""),
-                    "timestamp": msg.get("timestamp", ""),
-                    "type": "email"
-                })
-        
+        # 모든 데이터를 수집 (제너레이터 체인이라 중간 리스트를 만들지 않음)
+        all_items = [
+            *_iter_slack_items(slack_data),
+            *_iter_notion_items(notion_data),
+            *_iter_gmail_items(gmail_data),
+        ]
+
         # 데이터가 없으면 기본 그룹 반환
         if not all_items:
             return {
                 "General": []
             }
-        
+
         # 동적 그룹 생성 (LLM 없이 규칙 기반으로 먼저 시도)
         dynamic_groups = self._create_dynamic_groups(all_items)
-        
+
         return dynamic_groups
+
+    async def stream_all_items(self) -> AsyncIterator[Dict[str, Any]]:
+        """세 통합의 아이템을 수집이 끝나는 대로 스트리밍합니다.
+
+        get_all_info처럼 전체 결과를 한 번에 메모리에 쌓지 않고, 먼저
+        도착한 통합의 아이템부터 내보내 소비자가 수집과 겹쳐 처리할 수
+        있게 합니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce(fetch, iter_items):
+            try:
+                data = await fetch()
+                for item in iter_items(data):
+                    await queue.put(item)
+            finally:
+                await queue.put(_STREAM_DONE)
+
+        tasks = [
+            asyncio.create_task(produce(self.get_slack_info, _iter_slack_items)),
+            asyncio.create_task(produce(self.get_notion_info, _iter_notion_items)),
+            asyncio.create_task(produce(self.get_gmail_info, _iter_gmail_items)),
+        ]
+
+        finished = 0
+        try:
+            while finished < len(tasks):
+                item = await queue.get()
+                if item is _STREAM_DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def group_by_titles_stream(self) -> Dict[str, List[Dict[str, Any]]]:
+        """스트리밍 수집본을 도착 즉시 분류하여 그룹화합니다."""
+        groups = defaultdict(list)
+        classify = self._classify_item_to_group
+
+        async for item in self.stream_all_items():
+            text = _extract_text(item)
+            if text:
+                groups[classify(text)].append(item)
+
+        if not groups:
+            return {"General": []}
+        return dict(groups)
     
     def _create_dynamic_groups(self, all_items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """데이터를 분석하여 동적으로 그룹을 생성합니다."""
         # 키워드 기반으로 그룹 분류
-        groups = {}
-        
+        # 핫 루프에서 속성 조회를 없애기 위해 분류기/추출기를 로컬로 바인딩
+        groups = defaultdict(list)
+        classify = self._classify_item_to_group
+        extract = _extract_text
+
         for item in all_items:
-            # 아이템의 텍스트 추출
-            text = ""
-            if item.get("source") == "slack":
-                text = item.get("content", "")
-            elif item.get("source") == "notion":
-                text = item.get("title", "")
-            elif item.get("source") == "gmail":
-                text = f"{item.get('subject', '')} {item.get('snippet', '')}"
-            
+            # 아이템의 텍스트 추출 후 그룹 분류
+            text = extract(item)
             if not text:
                 continue
-            
-            # 그룹 분류
-            group_name = self._classify_item_to_group(text)
-            
-            # 그룹이 없으면 생성
-            if group_name not in groups:
-                groups[group_name] = []
-            
-            groups[group_name].append(item)
-        
-        # 빈 그룹 제거
-        return {k: v for k, v in groups.items() if v}
+
+            groups[classify(text)].append(item)
+
+        # append 시에만 키가 생기므로 빈 그룹은 존재할 수 없음
+        return dict(groups)
     
     def _classify_item_to_group(self, text: str) -> str:
         """텍스트를 분석하여 적절한 그룹명을 반환합니다."""
         text_lower = text.lower()
-        
-        # AI/ML 관련
-        if any(keyword in text_lower for keyword in [
-            "ai", "artificial intelligence", "machine learning", "ml", "deep learning", "dl",
-            "neural network", "신경망", "머신러닝", "딥러닝", "인공지능", "논문", "연구", 
-            "optimization", "최적화", "algorithm", "알고리즘", "bert", "gpt", "transformer",
-            "lora", "diffusion", "gan", "cnn", "rnn", "lstm"
-        ]):
-            return "AI_Research"
-        
-        # 프로젝트/개발 관련
-        if any(keyword in text_lower for keyword in [
-            "project", "프로젝트", "development", "개발", "implementation", "구현",
-            "code", "코드", "programming", "프로그래밍", "software", "소프트웨어",
-            "repository", "repo", "git", "github", "deployment", "배포",
-            "testing", "테스트", "debug", "디버그", "refactor", "리팩토링"
-        ]):
-            return "Development_Projects"
-        
-        # 학습/교육 관련
-        if any(keyword in text_lower for keyword in [
-            "study", "학습", "learning", "education", "교육", "course", "강의",
-            "tutorial", "튜토리얼", "workshop", "워크샵", "training", "훈련",
-            "book", "책", "documentation", "문서", "guide", "가이드",
-            "3주차", "4주차", "week", "chapter", "챕터"
-        ]):
-            return "Learning_Study"
-        
-        # 컨퍼런스/이벤트 관련
-        if any(keyword in text_lower for keyword in [
-            "conference", "컨퍼런스", "workshop", "워크샵", "symposium", "심포지엄",
-            "cfp", "call for papers", "submission", "제출", "deadline", "마감",
-            "registration", "등록", "icml", "neurips", "aaai", "ijcai",
-            "presentation", "발표", "poster", "포스터", "demo", "데모"
-        ]):
-            return "Conference_Events"
-        
-        # 데이터/분석 관련
-        if any(keyword in text_lower for keyword in [
-            "data", "데이터", "dataset", "데이터셋", "analysis", "분석",
-            "statistics", "통계", "visualization", "시각화", "chart", "차트",
-            "graph", "그래프", "table", "테이블", "csv", "json", "xml"
-        ]):
-            return "Data_Analysis"
-        
-        # 협업/커뮤니케이션 관련
-        if any(keyword in text_lower for keyword in [
-            "collaboration", "협업", "team", "팀", "meeting", "미팅", "회의",
-            "discussion", "논의", "chat", "채팅", "communication", "소통",
-            "feedback", "피드백", "review", "리뷰", "comment", "코멘트"
-        ]):
-            return "Collaboration_Communication"
-        
-        # 회고/계획 관련
-        if any(keyword in text_lower for keyword in [
-            "retrospective", "회고", "planning", "계획", "goal", "목표",
-            "milestone", "마일스톤", "timeline", "타임라인", "schedule", "일정",
-            "progress", "진행", "status", "상태", "update", "업데이트"
-        ]):
-            return "Planning_Retrospective"
-        
-        # 도구/기술 관련
-        if any(keyword in text_lower for keyword in [
-            "tool", "도구", "framework", "프레임워크", "library", "라이브러리",
-            "api", "sdk", "platform", "플랫폼", "service", "서비스",
-            "docker", "kubernetes", "cloud", "클라우드", "aws", "azure"
-        ]):
-            return "Tools_Technologies"
-        
+
+        # 자동자가 있으면 텍스트 1회 스캔으로 모든 키워드를 매칭하고
+        # 가장 우선순위 높은 카테고리를 선택
+        if self._classifier is not None:
+            best_priority = len(_CATEGORY_KEYWORDS)
+            best_category = _DEFAULT_CATEGORY
+            for _, (priority, category) in self._classifier.iter(text_lower):
+                if priority < best_priority:
+                    best_priority = priority
+                    best_category = category
+                    if priority == 0:
+                        break
+            return best_category
+
+        # 폴백: 텍스트를 토큰 집합으로 한 번 분해한 뒤 C 레벨 교집합으로 매칭
+        # (단어 경계 기준이라 "email"이 "ai"에 매칭되는 오탐도 방지)
+        tokens = frozenset(_TOKEN_RE.findall(text_lower))
+        for category, token_set, phrases in _CATEGORY_MATCHERS:
+            if tokens & token_set or any(phrase in text_lower for phrase in phrases):
+                return category
+
         # 기타/일반
-        return "General_Discussion"
+        return _DEFAULT_CATEGORY
@@ -3,24 +3,223 @@
 import asyncio
 import os
 import json
+import threading
+import time
+from collections import Counter
+from enum import IntEnum
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
+import aiohttp
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
+
+# libuv 기반 이벤트 루프 (미설치이거나 Windows면 기본 루프 사용)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 try:
-    from .base_mcp import BaseMCP
+    from .base_mcp import BaseMCP, write_json_file, write_jsonl_file
 except ImportError:
     # 직접 실행할 때를 위한 절대 경로
     import sys
     import os
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from base_mcp import BaseMCP
+    from base_mcp import BaseMCP, write_json_file, write_jsonl_file
+
+
+# 봇 토큰별 공유 AsyncWebClient 풀 — 같은 워크스페이스를 가리키는
+# SlackMCP 인스턴스들이 클라이언트(와 그 커넥션 풀)를 재사용하도록 함
+_SHARED_CLIENTS: Dict[str, AsyncWebClient] = {}
+
+
+class ConnState(IntEnum):
+    """연결 상태 머신 (전이는 항상 앞 방향).
+
+    이벤트 루프의 단일 스레드 보장 덕분에 await 사이의 단일 대입만으로
+    원자적 전이가 되므로 잠금 없이 is_connected를 속성 읽기로 처리할 수
+    있습니다.
+    """
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    DISCONNECTING = 3
+
+
+class AsyncLoopThread(threading.Thread):
+    """전용 이벤트 루프를 돌리는 데몬 스레드.
+
+    동기 코드가 호출마다 asyncio.run으로 루프를 만들었다 버리면 공유
+    클라이언트/캐시/세션 재사용이 모두 무효가 되므로, 프로세스에 하나만
+    띄워 두고 run_coroutine_sync로 제출합니다.
+    """
+
+    def __init__(self):
+        super().__init__(name="slack-mcp-loop", daemon=True)
+        # 소켓 중심 워크로드라 uvloop가 있으면 그쪽 루프를 사용
+        self.loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+_LOOP_THREAD: Optional[AsyncLoopThread] = None
+_LOOP_THREAD_LOCK = threading.Lock()
+
+
+def run_coroutine_sync(coro, timeout: Optional[float] = None) -> Any:
+    """동기 호출자용 브리지: 공용 루프 스레드에서 코루틴을 실행합니다.
+
+    예: run_coroutine_sync(slack.get_channels(include_private=True))
+    """
+    global _LOOP_THREAD
+    if _LOOP_THREAD is None:
+        with _LOOP_THREAD_LOCK:
+            if _LOOP_THREAD is None:
+                thread = AsyncLoopThread()
+                thread.start()
+                _LOOP_THREAD = thread
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP_THREAD.loop).result(timeout)
+
+
+def _retry_after(e: SlackApiError) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 값을 초 단위로 꺼냅니다 (없으면 None)."""
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _SlackRateLimiter:
+    """Retry-After 헤더로 구동되는 공유 레이트 리미터.
+
+    평시에는 요청을 전혀 지연시키지 않다가, Slack이 429를 반환하면
+    모든 호출자가 Retry-After가 지날 때까지 함께 대기합니다 — 고정
+    sleep처럼 예산이 남아도는 구간까지 벌점을 물리지 않습니다.
+    """
+
+    def __init__(self):
+        self._resume_at = 0.0
+
+    async def wait(self) -> None:
+        """현재 차단 구간이 있으면 끝날 때까지 대기합니다."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self, retry_after: float) -> None:
+        """429를 받은 호출자가 전체 차단 구간을 설정합니다."""
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+
+def _slack_error(e: SlackApiError) -> str:
+    """SlackApiError에서 에러 코드를 꺼냅니다.
+
+    str(e) 전체를 부분 문자열로 훑는 대신 응답의 error 필드를 직접
+    조회합니다 (예외 문자열 조립 + O(|메시지|) 스캔 제거).
+    """
+    response = getattr(e, "response", None)
+    if response is None:
+        return ""
+    try:
+        return response.get("error", "") or ""
+    except AttributeError:
+        return ""
+
+
+def _build_message(message: Dict[str, Any], channel_id: str,
+                   _fromts=datetime.fromtimestamp, _float=float) -> Dict[str, Any]:
+    """Slack 메시지 응답을 내부 메시지 dict로 변환합니다.
+
+    메시지당 한 번 호출되는 핫 경로라 모듈 함수로 두어 모든 이름이
+    로컬(기본 인자 포함)로 해석되게 하고, 반응/파일 목록은 append 루프
+    대신 리스트 컴프리헨션으로 만듭니다.
+    """
+    message_data = {
+        "id": message.get("ts"),
+        "channel_id": channel_id,
+        "user_id": message.get("user"),
+        "text": message.get("text", ""),
+        "timestamp": _fromts(_float(message["ts"])).isoformat() + "Z",
+        "thread_ts": message.get("thread_ts"),
+        "reply_count": message.get("reply_count", 0),
+        # 반응(이모지) 정보
+        "reactions": [
+            {
+                "name": reaction["name"],
+                "count": reaction["count"],
+                "users": reaction.get("users", [])
+            }
+            for reaction in message.get("reactions", ())
+        ]
+    }
+
+    # 첨부 파일 정보 (있을 때만 키 추가 — 기존 출력 형태 유지)
+    files = message.get("files")
+    if files:
+        message_data["files"] = [
+            {
+                "id": file.get("id"),
+                "name": file.get("name"),
+                "mimetype": file.get("mimetype"),
+                "size": file.get("size"),
+                "url": file.get("url_private")
+            }
+            for file in files
+        ]
+
+    return message_data
+
+
+def _shape_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Slack 사용자 응답을 내부 사용자 dict로 변환합니다."""
+    profile = user.get("profile", {})
+    return {
+        "id": user["id"],
+        "name": user.get("name"),
+        "real_name": user.get("real_name"),
+        "display_name": profile.get("display_name") or profile.get("real_name"),
+        "email": profile.get("email"),
+        "phone": profile.get("phone"),
+        "is_bot": user.get("is_bot", False),
+        "is_admin": user.get("is_admin", False),
+        "is_owner": user.get("is_owner", False),
+        "timezone": user.get("tz"),
+        "timezone_label": user.get("tz_label"),
+        "status_emoji": profile.get("status_emoji"),
+        "status_text": profile.get("status_text"),
+        "title": profile.get("title"),
+        "avatar_hash": profile.get("avatar_hash"),
+        "image_original": profile.get("image_original"),
+        "deleted": user.get("deleted", False),
+        "updated": datetime.fromtimestamp(user["updated"]).isoformat() + "Z" if user.get("updated") else None
+    }
+
+
+def _shared_client(bot_token: str) -> AsyncWebClient:
+    """토큰별로 하나의 AsyncWebClient를 만들어 재사용합니다."""
+    client = _SHARED_CLIENTS.get(bot_token)
+    if client is None:
+        client = _SHARED_CLIENTS.setdefault(bot_token, AsyncWebClient(token=bot_token))
+    return client
 
 
 class SlackMCP(BaseMCP):
     """Slack MCP 서버 연결을 담당하는 클래스."""
-    
+
+    # Slack search.messages는 불리언 OR 검색 구문을 지원
+    supports_or_query = True
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__("slack", config)
         
@@ -30,51 +229,96 @@ class SlackMCP(BaseMCP):
         self.app_token = config.get("app_token") or os.getenv("SLACK_APP_TOKEN")
         self.channels = config.get("channels", [])
         self.users = config.get("users", [])
+
+        # 헬스 체크가 고빈도로 읽는 개수는 미리 계산해 둔 속성으로 유지
+        # (목록이 실시간 로딩으로 바뀌어도 프로브는 O(1)을 유지)
+        self.channels_count = len(self.channels)
+        self.users_count = len(self.users)
         
-        # 데이터 저장 경로
+        # 데이터 저장 경로 (디렉토리 생성은 connect 또는 첫 저장에서 한 번만)
         self.output_dir = config.get("output_dir", "output/slack_data")
+        self._output_ready = False
         
-        # 연결 상태
-        self._connected = False
+        # 연결 상태 (잠금 없는 enum 전이)
+        self._state = ConnState.DISCONNECTED
         self._client = None
+
+        # 팬아웃 동시성 제한 (Slack 레이트 리밋 예산 내에서 파이프 유지)
+        self._sem = asyncio.Semaphore(int(config.get("max_concurrency", 8)))
+
+        # 429 Retry-After를 모든 호출자가 공유하는 리미터
+        self._rate_limiter = _SlackRateLimiter()
+
+        # 시간 단위로만 바뀌는 메타데이터의 TTL 캐시: key → (저장 시각, 값)
+        cache_ttls = config.get("cache_ttls", {})
+        self._cache_ttls = {
+            "workspace_info": cache_ttls.get("workspace_info", 3600.0),
+            "channels": cache_ttls.get("channels", 300.0),
+            "user_info": cache_ttls.get("user_info", 1800.0),
+        }
+        self._cache: Dict[tuple, tuple] = {}
+
+        # not_in_channel이 확인된 채널 ID — 같은 채널로의 재호출 차단
+        self._skip_channels: set = set()
+
+        # users.list 한 번으로 채우는 사용자 디렉터리 (id → 사용자 dict)
+        # N회의 users.info 대신 1회의 벌크 조회로 대체
+        self._user_directory: Optional[Dict[str, Dict[str, Any]]] = None
         
-        # Slack 클라이언트 초기화
+        # Slack 클라이언트 초기화 (같은 토큰이면 인스턴스 간 공유)
         if self.bot_token:
-            self._client = AsyncWebClient(token=self.bot_token)
+            self._client = _shared_client(self.bot_token)
     
     async def connect(self) -> bool:
         """Slack API에 연결하고 인증을 확인합니다."""
         try:
+            # 이미 연결돼 있으면 auth_test 왕복 없이 멱등 처리
+            if self._state == ConnState.CONNECTED:
+                return True
+
             self.logger.info("Connecting to Slack API...")
-            
+
             if not self._client:
                 raise ValueError("Slack 클라이언트가 초기화되지 않았습니다. 토큰을 확인해주세요.")
-            
+
+            self._state = ConnState.CONNECTING
+
+            # slack_sdk는 session 미지정 시 호출마다 ClientSession을 새로
+            # 만들므로, keep-alive 커넥션 풀을 가진 세션 하나를 붙여
+            # TLS 핸드셰이크를 호출당 1회에서 연결당 1회로 줄임
+            if self._client.session is None or self._client.session.closed:
+                self._client.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75)
+                )
+
             # API 테스트 및 인증 확인
             response = await self._client.auth_test()
-            
+
             if response["ok"]:
                 self.workspace_id = response.get("team_id", self.workspace_id)
                 self.user_id = response.get("user_id")
                 self.bot_id = response.get("bot_id")
-                
-                self._connected = True
+
+                self._state = ConnState.CONNECTED
                 self.update_connection_status("connected")
-                self.logger.info(f"Successfully connected to Slack workspace: {response.get('team')}")
+                self.logger.info("Successfully connected to Slack workspace: %s", response.get('team'))
                 
                 # 출력 디렉토리 생성
                 os.makedirs(self.output_dir, exist_ok=True)
-                
+                self._output_ready = True
+
                 return True
             else:
                 raise SlackApiError("인증 실패", response)
             
         except SlackApiError as e:
-            self.logger.error(f"Slack API 에러: {e.response.get('error', str(e))}")
+            self._state = ConnState.DISCONNECTED
+            self.logger.error("Slack API 에러: %s", e.response.get('error', str(e)))
             self.update_connection_status("failed", str(e))
             return False
         except Exception as e:
-            self.logger.error(f"Slack 연결 실패: {e}")
+            self._state = ConnState.DISCONNECTED
+            self.logger.error("Slack 연결 실패: %s", e)
             self.update_connection_status("failed", str(e))
             return False
     
@@ -82,23 +326,32 @@ class SlackMCP(BaseMCP):
         """Slack MCP 서버 연결을 해제합니다."""
         try:
             self.logger.info("Disconnecting from Slack MCP server...")
-            
-            # 실제 구현에서는 연결 해제 로직
-            await asyncio.sleep(0.5)
-            
-            self._connected = False
+
+            self._state = ConnState.DISCONNECTING
+            self._cache.clear()
+            self._user_directory = None
+            self._skip_channels.clear()
+
+            # 공유 HTTP 세션 정리 (다음 connect에서 다시 생성)
+            if (self._client is not None
+                    and self._client.session is not None
+                    and not self._client.session.closed):
+                await self._client.session.close()
+                self._client.session = None
+
+            self._state = ConnState.DISCONNECTED
             self.update_connection_status("disconnected")
             self.logger.info("Successfully disconnected from Slack MCP server")
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to disconnect from Slack MCP server: {e}")
+            self.logger.error("Failed to disconnect from Slack MCP server: %s", e)
             return False
     
     async def is_connected(self) -> bool:
-        """연결 상태를 확인합니다."""
-        return self._connected
+        """연결 상태를 확인합니다 (잠금 없는 속성 읽기)."""
+        return self._state == ConnState.CONNECTED
     
     async def health_check(self) -> Dict[str, Any]:
         """Slack MCP 서버 상태를 확인합니다."""
@@ -110,16 +363,13 @@ class SlackMCP(BaseMCP):
                     "timestamp": self._get_current_timestamp()
                 }
             
-            # 실제 구현에서는 서버 상태 확인
-            await asyncio.sleep(0.1)
-            
             return {
                 "status": "healthy",
                 "message": "Slack MCP server is responding",
                 "timestamp": self._get_current_timestamp(),
                 "workspace_id": self.workspace_id,
-                "channels_count": len(self.channels),
-                "users_count": len(self.users)
+                "channels_count": self.channels_count,
+                "users_count": self.users_count
             }
             
         except Exception as e:
@@ -129,9 +379,46 @@ class SlackMCP(BaseMCP):
                 "timestamp": self._get_current_timestamp()
             }
     
+    async def _cached(self, key: tuple, ttl: float, fetch) -> Any:
+        """TTL 내에는 캐시 값을 반환하고, 지나면 새로 받아 갱신합니다.
+
+        값 대신 태스크를 저장하므로 같은 키의 동시 호출자들은 진행 중인
+        요청 하나에 합류합니다 (single-flight) — 팬아웃 시 중복 왕복과
+        429 압박이 사라집니다.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, task = entry
+            if not task.done():
+                # 동일 요청이 진행 중이면 그 결과를 공유
+                return await task
+            if task.exception() is None and time.monotonic() - stored_at < ttl:
+                return task.result()
+
+        task = asyncio.ensure_future(fetch())
+        self._cache[key] = (time.monotonic(), task)
+        try:
+            return await task
+        except Exception:
+            # 실패한 결과는 캐시에 남기지 않음
+            self._cache.pop(key, None)
+            raise
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """캐시를 비웁니다 (prefix 지정 시 해당 종류만)."""
+        if prefix is None:
+            self._cache.clear()
+        else:
+            for key in [k for k in self._cache if k[0] == prefix]:
+                del self._cache[key]
+
     async def get_workspace_info(self) -> Dict[str, Any]:
-        """워크스페이스 정보를 가져옵니다."""
-        return await self.execute_with_retry(self._get_workspace_info_impl)
+        """워크스페이스 정보를 가져옵니다 (TTL 캐시)."""
+        return await self._cached(
+            ("workspace_info",),
+            self._cache_ttls["workspace_info"],
+            lambda: self.execute_with_retry(self._get_workspace_info_impl)
+        )
     
     async def _get_workspace_info_impl(self) -> Dict[str, Any]:
         """워크스페이스 정보를 가져오는 실제 구현."""
@@ -151,7 +438,7 @@ class SlackMCP(BaseMCP):
                 if users_list["ok"]:
                     member_count = len([u for u in users_list.get("members", []) if not u.get("deleted", False)])
             except Exception as e:
-                self.logger.warning(f"사용자 목록 조회 건너뜀 (Rate Limiting 방지): {e}")
+                self.logger.warning("사용자 목록 조회 건너뜀 (Rate Limiting 방지): %s", e)
             
             workspace_info = {
                 "workspace_id": team["id"],
@@ -169,211 +456,283 @@ class SlackMCP(BaseMCP):
             return workspace_info
             
         except SlackApiError as e:
-            self.logger.error(f"워크스페이스 정보 조회 실패: {e}")
+            self.logger.error("워크스페이스 정보 조회 실패: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"워크스페이스 정보 처리 실패: {e}")
+            self.logger.error("워크스페이스 정보 처리 실패: %s", e)
             raise
     
     async def get_channels(self, include_private: bool = False) -> List[Dict[str, Any]]:
-        """채널 목록을 가져옵니다."""
-        return await self.execute_with_retry(self._get_channels_impl, include_private)
+        """채널 목록을 가져옵니다 (TTL 캐시)."""
+        return await self._cached(
+            ("channels", include_private),
+            self._cache_ttls["channels"],
+            lambda: self.execute_with_retry(self._get_channels_impl, include_private)
+        )
     
     async def _get_channels_impl(self, include_private: bool = False) -> List[Dict[str, Any]]:
-        """채널 목록을 가져오는 실제 구현."""
+        """채널 목록을 가져오는 실제 구현.
+
+        conversations_list 응답에 필요한 필드(이름/토픽/num_members 등)가
+        모두 들어 있으므로 채널별 conversations_info/members 추가 호출
+        (2N+1 패턴)을 하지 않고, 큰 페이지 단위 커서 페이지네이션으로
+        요청 수를 페이지 수 수준까지 줄입니다.
+        """
         try:
+            types = "public_channel,private_channel" if include_private else "public_channel"
             channels = []
-            
-            # 채널 가져오기 - 권한에 따라 조정
-            try:
-                if include_private:
-                    # 비공개 채널도 포함하려고 시도
-                    conversations = await self._client.conversations_list(
-                        types="public_channel,private_channel"
-                    )
-                else:
-                    # 공개 채널만
-                    conversations = await self._client.conversations_list(
-                        types="public_channel"
-                    )
-            except SlackApiError as e:
-                if "missing_scope" in str(e) and "groups:read" in str(e):
-                    # groups:read 권한이 없으면 공개 채널만 조회 (조용히 처리)
+            cursor = None
+
+            while True:
+                try:
                     conversations = await self._client.conversations_list(
-                        types="public_channel"
+                        types=types,
+                        exclude_archived=True,
+                        limit=1000,
+                        cursor=cursor
                     )
-                else:
+                except SlackApiError as e:
+                    if _slack_error(e) == "missing_scope" and types != "public_channel":
+                        # 비공개 채널 권한이 없으면 공개 채널만 다시 조회 (조용히 처리)
+                        types = "public_channel"
+                        cursor = None
+                        channels.clear()
+                        continue
                     raise
-            
-            if not conversations["ok"]:
-                raise SlackApiError("채널 목록 조회 실패", conversations)
-            
-            for channel in conversations.get("channels", []):
-                # 채널 상세 정보 가져오기
-                channel_info = await self._client.conversations_info(channel=channel["id"])
-                
-                if channel_info["ok"]:
-                    ch = channel_info["channel"]
-                    
-                    # 채널 멤버 수 가져오기
-                    try:
-                        members = await self._client.conversations_members(channel=channel["id"])
-                        member_count = len(members.get("members", [])) if members["ok"] else 0
-                    except SlackApiError as e:
-                        if "not_in_channel" in str(e):
-                            # 봇이 채널에 참여하지 않은 경우 (조용히 처리)
-                            member_count = "N/A"
-                        else:
-                            member_count = 0
-                    except Exception:
-                        member_count = 0
-                    
-                    channel_data = {
+
+                if not conversations["ok"]:
+                    raise SlackApiError("채널 목록 조회 실패", conversations)
+
+                for ch in conversations.get("channels", []):
+                    channels.append({
                         "id": ch["id"],
                         "name": ch["name"],
                         "is_private": ch.get("is_private", False),
                         "is_archived": ch.get("is_archived", False),
-                        "member_count": member_count,
+                        "is_member": ch.get("is_member", True),
+                        "member_count": ch.get("num_members", "N/A"),
                         "topic": ch.get("topic", {}).get("value", ""),
                         "purpose": ch.get("purpose", {}).get("value", ""),
                         "created": datetime.fromtimestamp(ch["created"]).isoformat() + "Z" if ch.get("created") else None,
                         "creator": ch.get("creator")
-                    }
-                    channels.append(channel_data)
-            
+                    })
+
+                cursor = conversations.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+
             # 개별 저장 제거 - 통합 저장에서 처리
-            
+
             return channels
-            
+
         except SlackApiError as e:
-            self.logger.error(f"채널 목록 조회 실패: {e}")
+            self.logger.error("채널 목록 조회 실패: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"채널 정보 처리 실패: {e}")
+            self.logger.error("채널 정보 처리 실패: %s", e)
             raise
     
     async def get_channel_messages(self, channel_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """채널의 메시지를 가져옵니다."""
         return await self.execute_with_retry(self._get_channel_messages_impl, channel_id, limit)
     
-    async def _get_channel_messages_impl(self, channel_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """채널 메시지를 가져오는 실제 구현."""
-        try:
-            messages = []
-            
-            # 채널 히스토리 가져오기 (최근 메시지부터)
+    async def _iter_message_pages(self, channel_id: str, limit: Optional[int] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """conversations_history의 원시 메시지 페이지를 순서대로 내보냅니다.
+
+        페이지 단위 소비자는 다음 페이지가 수신되는 동안 직전 페이지를
+        가공/직렬화할 수 있습니다 (네트워크 I/O와 CPU 작업의 겹침).
+        """
+        if channel_id in self._skip_channels:
+            return
+
+        cursor = None
+        remaining = limit
+
+        while True:
+            page_limit = 1000 if remaining is None else min(remaining, 1000)
+
             try:
                 history = await self._client.conversations_history(
                     channel=channel_id,
-                    limit=min(limit, 1000)  # Slack API 제한
+                    limit=page_limit,
+                    cursor=cursor
                 )
-                
+
                 if not history["ok"]:
                     if history.get("error") == "not_in_channel":
-                        # 봇이 채널에 참여하지 않은 경우 조용히 처리
-                        return []
-                    else:
-                        raise SlackApiError("메시지 히스토리 조회 실패", history)
+                        # 봇이 채널에 참여하지 않은 경우 조용히 종료
+                        self._skip_channels.add(channel_id)
+                        return
+                    raise SlackApiError("메시지 히스토리 조회 실패", history)
             except SlackApiError as e:
-                if "not_in_channel" in str(e):
-                    # 봇이 채널에 참여하지 않은 경우 조용히 빈 리스트 반환
-                    return []
-                else:
-                    raise
-            
-            for message in history.get("messages", []):
-                # 메시지 데이터 정리
-                message_data = {
-                    "id": message.get("ts"),
-                    "channel_id": channel_id,
-                    "user_id": message.get("user"),
-                    "text": message.get("text", ""),
-                    "timestamp": datetime.fromtimestamp(float(message["ts"])).isoformat() + "Z",
-                    "thread_ts": message.get("thread_ts"),
-                    "reply_count": message.get("reply_count", 0),
-                    "reactions": []
-                }
-                
-                # 반응(이모지) 정보 추가
-                if "reactions" in message:
-                    for reaction in message["reactions"]:
-                        message_data["reactions"].append({
-                            "name": reaction["name"],
-                            "count": reaction["count"],
-                            "users": reaction.get("users", [])
-                        })
-                
-                # 첨부 파일 정보 추가
-                if "files" in message:
-                    message_data["files"] = []
-                    for file in message["files"]:
-                        message_data["files"].append({
-                            "id": file.get("id"),
-                            "name": file.get("name"),
-                            "mimetype": file.get("mimetype"),
-                            "size": file.get("size"),
-                            "url": file.get("url_private")
-                        })
-                
-                messages.append(message_data)
-            
-            # 개별 저장 제거 - 통합 저장에서 처리
-            
-            return messages[:limit]
-            
+                if _slack_error(e) == "not_in_channel":
+                    # 봇이 채널에 참여하지 않은 경우 조용히 종료
+                    self._skip_channels.add(channel_id)
+                    return
+                raise
+
+            messages = history.get("messages", [])
+            if messages:
+                yield messages
+                if remaining is not None:
+                    remaining -= len(messages)
+                    if remaining <= 0:
+                        return
+
+            cursor = history.get("response_metadata", {}).get("next_cursor")
+            if not history.get("has_more") or not cursor:
+                return
+
+    async def iter_channel_messages(self, channel_id: str, limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """채널 메시지를 커서 페이지네이션으로 한 건씩 스트리밍합니다.
+
+        전체 리스트를 먼저 쌓지 않으므로 호출자가 일부만 소비하고
+        끊어도 남은 페이지를 받지 않으며, 첫 메시지까지의 지연이
+        페이지 1장 수준으로 줄어듭니다.
+        """
+        count = 0
+        async for page in self._iter_message_pages(channel_id, limit):
+            for message in page:
+                yield _build_message(message, channel_id)
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    async def _get_channel_messages_impl(self, channel_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """채널 메시지를 가져오는 실제 구현 (스트리밍 수집을 리스트로 모음)."""
+        try:
+            return [message async for message in self.iter_channel_messages(channel_id, limit)]
+
         except SlackApiError as e:
-            self.logger.error(f"채널 메시지 조회 실패: {e}")
+            self.logger.error("채널 메시지 조회 실패: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"메시지 처리 실패: {e}")
+            self.logger.error("메시지 처리 실패: %s", e)
             raise
     
+    def _eligible_channels(self, channels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """메시지 수집 대상이 되는 채널만 남깁니다.
+
+        보관된 채널과 봇이 참여하지 않은 채널은 빈 응답이나 경고만 내는
+        왕복이므로, 디스패치 전에 걸러 API 호출 자체를 없앱니다.
+        """
+        return [
+            channel for channel in channels
+            if not channel.get("is_archived")
+            and channel.get("is_member", True)
+            and channel["id"] not in self._skip_channels
+        ]
+
+    async def _bounded(self, coro):
+        """팬아웃 호출을 세마포어로 감싸 동시 요청 수를 제한합니다.
+
+        gather로 수백 개를 한꺼번에 날리면 429 재시도 폭풍이 나므로,
+        사전 제한이 사후 백오프보다 왕복 낭비가 적습니다.
+        """
+        async with self._sem:
+            await self._rate_limiter.wait()
+            return await coro
+
+    async def get_channel_messages_bulk(self, channel_ids: List[str], limit: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 채널의 메시지를 동시에 가져옵니다.
+
+        채널별 순차 대기 대신 전체를 한 번에 스케줄링하여 벽시계 시간을
+        가장 느린 채널 하나 수준으로 줄입니다. 실패한 채널은 빈 리스트로
+        반환되어 배치 전체가 취소되지 않습니다.
+        """
+        results = await asyncio.gather(
+            *(self._bounded(self.get_channel_messages(channel_id, limit)) for channel_id in channel_ids),
+            return_exceptions=True
+        )
+
+        messages_by_channel = {}
+        for channel_id, result in zip(channel_ids, results):
+            if isinstance(result, Exception):
+                self.logger.warning("채널 %s 메시지 일괄 조회 실패: %s", channel_id, result)
+                messages_by_channel[channel_id] = []
+            else:
+                messages_by_channel[channel_id] = result
+        return messages_by_channel
+
+    async def get_users_bulk(self, user_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 사용자 정보를 동시에 가져옵니다."""
+        results = await asyncio.gather(
+            *(self._bounded(self.get_user_info(user_id)) for user_id in user_ids),
+            return_exceptions=True
+        )
+
+        users_by_id = {}
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                self.logger.warning("사용자 %s 일괄 조회 실패: %s", user_id, result)
+                users_by_id[user_id] = None
+            else:
+                users_by_id[user_id] = result
+        return users_by_id
+
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """사용자 정보를 가져옵니다."""
-        return await self.execute_with_retry(self._get_user_info_impl, user_id)
+        """사용자 정보를 가져옵니다 (TTL 캐시)."""
+        return await self._cached(
+            ("user_info", user_id),
+            self._cache_ttls["user_info"],
+            lambda: self.execute_with_retry(self._get_user_info_impl, user_id)
+        )
     
+    async def _load_user_directory(self) -> Dict[str, Dict[str, Any]]:
+        """users.list를 커서 페이지네이션으로 순회하여 전체 디렉터리를 만듭니다."""
+        directory: Dict[str, Dict[str, Any]] = {}
+        cursor = None
+
+        while True:
+            response = await self._client.users_list(cursor=cursor, limit=200)
+            if not response["ok"]:
+                raise SlackApiError("사용자 목록 조회 실패", response)
+
+            for user in response.get("members", []):
+                directory[user["id"]] = _shape_user(user)
+
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+        return directory
+
     async def _get_user_info_impl(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """사용자 정보를 가져오는 실제 구현."""
+        """사용자 정보를 가져오는 실제 구현.
+
+        첫 호출에서 users.list 벌크 조회로 디렉터리를 채워, 이후
+        조회는 네트워크 왕복 없는 dict 조회가 됩니다. 디렉터리에
+        없는 id(신규 가입자 등)만 개별 users.info로 보충합니다.
+        """
         try:
-            # 사용자 정보 가져오기
+            if self._user_directory is None:
+                try:
+                    self._user_directory = await self._load_user_directory()
+                except Exception as e:
+                    self.logger.warning("사용자 디렉터리 구축 실패, 개별 조회로 폴백: %s", e)
+                    self._user_directory = {}
+
+            cached = self._user_directory.get(user_id)
+            if cached is not None:
+                return cached
+
+            # 디렉터리에 없는 사용자만 개별 조회
             user_info = await self._client.users_info(user=user_id)
-            
+
             if not user_info["ok"]:
                 if user_info.get("error") == "user_not_found":
                     return None
                 raise SlackApiError("사용자 정보 조회 실패", user_info)
-            
-            user = user_info["user"]
-            profile = user.get("profile", {})
-            
-            user_data = {
-                "id": user["id"],
-                "name": user.get("name"),
-                "real_name": user.get("real_name"),
-                "display_name": profile.get("display_name") or profile.get("real_name"),
-                "email": profile.get("email"),
-                "phone": profile.get("phone"),
-                "is_bot": user.get("is_bot", False),
-                "is_admin": user.get("is_admin", False),
-                "is_owner": user.get("is_owner", False),
-                "timezone": user.get("tz"),
-                "timezone_label": user.get("tz_label"),
-                "status_emoji": profile.get("status_emoji"),
-                "status_text": profile.get("status_text"),
-                "title": profile.get("title"),
-                "avatar_hash": profile.get("avatar_hash"),
-                "image_original": profile.get("image_original"),
-                "deleted": user.get("deleted", False),
-                "updated": datetime.fromtimestamp(user["updated"]).isoformat() + "Z" if user.get("updated") else None
-            }
-            
+
+            user_data = _shape_user(user_info["user"])
+            self._user_directory[user_id] = user_data
             return user_data
-            
+
         except SlackApiError as e:
-            self.logger.error(f"사용자 정보 조회 실패: {e}")
+            self.logger.error("사용자 정보 조회 실패: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"사용자 정보 처리 실패: {e}")
+            self.logger.error("사용자 정보 처리 실패: %s", e)
             return None
     
     async def search_messages(self, query: str, channel_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -391,10 +750,12 @@ class SlackMCP(BaseMCP):
                 search_query = f"{query} {channel_filter}"
             
             # 메시지 검색
+            # 서버 측 인덱스에서 검색 (기본 20건 페이지 대신 최대 100건씩)
             search_result = await self._client.search_messages(
                 query=search_query,
                 sort="timestamp",
-                sort_dir="desc"
+                sort_dir="desc",
+                count=100
             )
             
             if not search_result["ok"]:
@@ -435,10 +796,10 @@ class SlackMCP(BaseMCP):
             return messages
             
         except SlackApiError as e:
-            self.logger.error(f"메시지 검색 실패: {e}")
+            self.logger.error("메시지 검색 실패: %s", e)
             return []
         except Exception as e:
-            self.logger.error(f"검색 처리 실패: {e}")
+            self.logger.error("검색 처리 실패: %s", e)
             return []
     
     async def get_recent_activity(self, hours: int = 24) -> Dict[str, Any]:
@@ -453,65 +814,66 @@ class SlackMCP(BaseMCP):
             start_time = end_time - timedelta(hours=hours)
             oldest_ts = str(start_time.timestamp())
             
-            # 채널 목록 가져오기
-            channels = await self.get_channels(include_private=True)
-            
+            # 채널 목록 가져오기 (수집 불가 채널은 조기에 제외)
+            channels = self._eligible_channels(
+                await self.get_channels(include_private=True)
+            )
+
             activity_data = {
                 "period_hours": hours,
                 "start_time": start_time.isoformat() + "Z",
                 "end_time": end_time.isoformat() + "Z",
                 "total_messages": 0,
                 "active_channels": 0,
-                "active_users": set(),
-                "channel_activity": {},
-                "user_activity": {}
+                # C 레벨 집계 + 힙 기반 most_common을 쓰기 위한 Counter
+                "channel_activity": Counter(),
+                "user_activity": Counter()
             }
             
-            # 각 채널의 최근 활동 분석
-            for channel in channels:
-                try:
-                    # Rate Limiting 방지를 위한 지연
-                    await asyncio.sleep(1.0)  # Rate Limiting 방지를 위해 딜레이 증가
-                    
-                    # 채널의 최근 메시지 가져오기
-                    history = await self._client.conversations_history(
-                        channel=channel["id"],
-                        oldest=oldest_ts,
-                        limit=1000
-                    )
-                    
-                    if history["ok"]:
-                        messages = history.get("messages", [])
-                        if messages:
-                            activity_data["active_channels"] += 1
-                            activity_data["total_messages"] += len(messages)
-                            activity_data["channel_activity"][channel["name"]] = len(messages)
-                            
-                            # 사용자별 메시지 수 계산
-                            for message in messages:
-                                user_id = message.get("user")
-                                if user_id:
-                                    activity_data["active_users"].add(user_id)
-                                    if user_id not in activity_data["user_activity"]:
-                                        activity_data["user_activity"][user_id] = 0
-                                    activity_data["user_activity"][user_id] += 1
-                                    
-                except Exception as e:
-                    self.logger.warning(f"채널 {channel['name']} 활동 분석 실패: {e}")
+            # 각 채널의 최근 활동 분석 (세마포어 제한 동시 실행)
+            async def fetch_history(channel):
+                async with self._sem:
+                    # 고정 sleep 대신 429가 실제로 발생했을 때만 공유 차단
+                    await self._rate_limiter.wait()
+                    try:
+                        return await self._client.conversations_history(
+                            channel=channel["id"],
+                            oldest=oldest_ts,
+                            limit=1000
+                        )
+                    except SlackApiError as e:
+                        retry_after = _retry_after(e)
+                        if retry_after is not None:
+                            self._rate_limiter.throttle(retry_after)
+                        raise
+
+            history_results = await asyncio.gather(
+                *(fetch_history(channel) for channel in channels),
+                return_exceptions=True
+            )
+
+            for channel, history in zip(channels, history_results):
+                if isinstance(history, Exception):
+                    self.logger.warning("채널 %s 활동 분석 실패: %s", channel['name'], history)
                     continue
+
+                if history["ok"]:
+                    messages = history.get("messages", [])
+                    if messages:
+                        activity_data["active_channels"] += 1
+                        activity_data["total_messages"] += len(messages)
+                        activity_data["channel_activity"][channel["name"]] = len(messages)
+
+                        # 사용자별 메시지 수 계산 (활성 사용자 수는 Counter
+                        # 키 수로 얻으므로 별도 set 유지가 필요 없음)
+                        for message in messages:
+                            user_id = message.get("user")
+                            if user_id:
+                                activity_data["user_activity"][user_id] += 1
             
-            # 상위 채널 및 사용자 정렬
-            top_channels = sorted(
-                activity_data["channel_activity"].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            top_users = sorted(
-                activity_data["user_activity"].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            # 상위 채널 및 사용자 (전체 정렬 O(N log N) 대신 힙 기반 O(N log 10))
+            top_channels = activity_data["channel_activity"].most_common(10)
+            top_users = activity_data["user_activity"].most_common(10)
             
             # 최종 결과 구성
             result = {
@@ -520,7 +882,7 @@ class SlackMCP(BaseMCP):
                 "end_time": activity_data["end_time"],
                 "total_messages": activity_data["total_messages"],
                 "active_channels": activity_data["active_channels"],
-                "active_users": len(activity_data["active_users"]),
+                "active_users": len(activity_data["user_activity"]),
                 "top_channels": [{"channel": ch, "message_count": count} for ch, count in top_channels],
                 "top_users": [{"user_id": user, "message_count": count} for user, count in top_users]
             }
@@ -530,30 +892,37 @@ class SlackMCP(BaseMCP):
             return result
             
         except Exception as e:
-            self.logger.error(f"최근 활동 분석 실패: {e}")
+            self.logger.error("최근 활동 분석 실패: %s", e)
             raise
     
     async def _save_data(self, data: Any, filename: str) -> None:
         """데이터를 JSON 파일로 저장합니다."""
         try:
-            # 출력 디렉토리 생성
-            os.makedirs(self.output_dir, exist_ok=True)
-            
+            # 출력 디렉토리는 connect에서 이미 만들어짐 (방어적 지연 생성만)
+            self._ensure_output_dir()
+
             # 파일 경로 생성
             file_path = os.path.join(self.output_dir, filename)
-            
-            # JSON으로 저장
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"데이터 저장 완료: {file_path}")
+
+            # JSON으로 저장 (orjson 우선, 단일 os.write)
+            # 대용량 덤프가 이벤트 루프를 막지 않도록 스레드로 오프로드
+            await asyncio.to_thread(write_json_file, file_path, data)
+
+            self.logger.info("데이터 저장 완료: %s", file_path)
             
         except Exception as e:
-            self.logger.error(f"데이터 저장 실패 ({filename}): {e}")
+            self.logger.error("데이터 저장 실패 (%s): %s", filename, e)
     
+    def _ensure_output_dir(self) -> None:
+        """출력 디렉토리를 아직 만들지 않았을 때만 생성합니다 (저장당 syscall 제거)."""
+        if not self._output_ready:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._output_ready = True
+
     async def save_slack_data(self, workspace_info, channels, all_messages):
         """Slack 데이터를 직관적인 구조로 저장"""
         try:
+            self._ensure_output_dir()
             # 1. 채널 정보 저장
             channels_data = {
                 "timestamp": datetime.now().isoformat() + "Z",
@@ -562,29 +931,28 @@ class SlackMCP(BaseMCP):
             }
             
             channels_file = os.path.join(self.output_dir, "channels_info.json")
-            with open(channels_file, 'w', encoding='utf-8') as f:
-                json.dump(channels_data, f, ensure_ascii=False, indent=2)
-            
-            # 2. 각 채널별 메시지 저장
+            # orjson 직렬화 + 단일 os.write, 이벤트 루프를 막지 않게 스레드 오프로드
+            await asyncio.to_thread(write_json_file, channels_file, channels_data)
+
+            # 2. 각 채널별 메시지 저장 (파일 쓰기를 동시 실행 — 쓰기 구간이
+            # 합계가 아닌 가장 느린 파일 하나 수준이 됨)
+            # 메시지는 JSONL(줄당 1건)로 기록해 소비자가 전체 배열을
+            # 메모리에 올리지 않고 스트리밍으로 읽을 수 있게 함
             saved_files = [channels_file]
+            write_tasks = []
             for channel_name, messages in all_messages.items():
                 if messages:  # 메시지가 있는 채널만 저장
-                    message_file = os.path.join(self.output_dir, f"messages_{channel_name}.json")
-                    message_data = {
-                        "channel": channel_name,
-                        "timestamp": datetime.now().isoformat() + "Z",
-                        "message_count": len(messages),
-                        "messages": messages
-                    }
-                    
-                    with open(message_file, 'w', encoding='utf-8') as f:
-                        json.dump(message_data, f, ensure_ascii=False, indent=2)
+                    message_file = os.path.join(self.output_dir, f"messages_{channel_name}.jsonl")
+                    write_tasks.append(asyncio.to_thread(write_jsonl_file, message_file, messages))
                     saved_files.append(message_file)
+
+            if write_tasks:
+                await asyncio.gather(*write_tasks)
             
             return saved_files
             
         except Exception as e:
-            self.logger.error(f"데이터 저장 실패: {e}")
+            self.logger.error("데이터 저장 실패: %s", e)
             return None
     
     async def collect_all_data(self) -> Dict[str, Any]:
@@ -600,31 +968,30 @@ class SlackMCP(BaseMCP):
                 "recent_activity": None
             }
             
-            # 1. 워크스페이스 정보 수집
-            self.logger.info("워크스페이스 정보 수집 중...")
-            collected_data["workspace_info"] = await self.get_workspace_info()
-            
-            # 2. 채널 목록 수집
-            self.logger.info("채널 목록 수집 중...")
-            channels = await self.get_channels(include_private=True)
+            # 1+2. 워크스페이스 정보와 채널 목록은 독립 호출이므로 동시 수집
+            self.logger.info("워크스페이스 정보/채널 목록 수집 중...")
+            workspace_info, channels = await asyncio.gather(
+                self.get_workspace_info(),
+                self.get_channels(include_private=True)
+            )
+            collected_data["workspace_info"] = workspace_info
             collected_data["channels"] = channels
-            
-            # 3. 각 채널의 메시지 수집
-            for channel in channels:
-                try:
-                    self.logger.info(f"채널 '{channel['name']}' 메시지 수집 중...")
-                    messages = await self.get_channel_messages(channel["id"], limit=500)
-                    collected_data["messages"][channel["name"]] = messages
-                    
-                    # 사용자 정보 수집 제거 (Rate Limiting 방지)
-                                
-                except Exception as e:
-                    self.logger.error(f"채널 '{channel['name']}' 데이터 수집 실패: {e}")
-                    continue
-            
-            # 4. 최근 활동 분석
-            self.logger.info("최근 활동 분석 중...")
-            collected_data["recent_activity"] = await self.get_recent_activity(24)
+
+            # 3+4. 메시지 수집과 최근 활동 분석도 서로 독립 — 같은
+            # 세마포어/리미터 예산 안에서 겹쳐 실행
+            self.logger.info("채널 메시지 수집 및 최근 활동 분석 중...")
+            # 보관 채널/미참여 채널은 빈 응답만 돌려주므로 디스패치에서 제외
+            collectable = self._eligible_channels(channels)
+            messages_by_id, recent_activity = await asyncio.gather(
+                self.get_channel_messages_bulk(
+                    [channel["id"] for channel in collectable],
+                    limit=500
+                ),
+                self.get_recent_activity(24)
+            )
+            for channel in collectable:
+                collected_data["messages"][channel["name"]] = messages_by_id.get(channel["id"], [])
+            collected_data["recent_activity"] = recent_activity
             
             # 5. 새로운 구조로 데이터 저장
             saved_files = await self.save_slack_data(
@@ -639,7 +1006,7 @@ class SlackMCP(BaseMCP):
             return collected_data
             
         except Exception as e:
-            self.logger.error(f"Slack 데이터 수집 실패: {e}")
+            self.logger.error("Slack 데이터 수집 실패: %s", e)
             raise
 
 
@@ -687,11 +1054,11 @@ async def main():
         print(f"   📄 channels_info.json (채널 정보)")
         
         # 메시지 파일들 표시
-        message_files = [f for f in saved_files if f.endswith('.json') and 'messages_' in f]
+        message_files = [f for f in saved_files if f.endswith('.jsonl') and 'messages_' in f]
         for file_path in message_files:
             filename = os.path.basename(file_path)
-            channel_name = filename.replace('messages_', '').replace('.json', '')
-            print(f"   💬 messages_{channel_name}.json")
+            channel_name = filename.replace('messages_', '').replace('.jsonl', '')
+            print(f"   💬 messages_{channel_name}.jsonl")
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
@@ -702,4 +1069,6 @@ async def main():
 
 if __name__ == "__main__":
     import asyncio
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())